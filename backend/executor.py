@@ -4,14 +4,42 @@ MCP Agent Executor Module
 This module provides parallel execution of AI models/MCP servers using mcp-agent
 with proper concurrent processing and result standardization.
 """
+import asyncio
+import logging
 import os
-from typing import List, Dict, Optional, Union
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
+_DOTENV_PATH = Path(__file__).parent / '.env'
+_DOTENV_LOADED = False
+
+
+def _load_env_once() -> None:
+    """Load the backend .env file a single time per process."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    load_dotenv(_DOTENV_PATH, override=True)
+    _DOTENV_LOADED = True
+
+
+def reload_env() -> None:
+    """Explicitly re-read the backend .env file, overriding current values."""
+    global _DOTENV_LOADED
+    load_dotenv(_DOTENV_PATH, override=True)
+    _DOTENV_LOADED = True
+    # Provider defaults are read from the environment, so drop memoized configs
+    _resolve_provider_config.cache_clear()
+
+
 # Load environment variables from .env file
-load_dotenv(Path(__file__).parent / '.env')
+_load_env_once()
 
 # Import mcp-agent components (following llm_agent.py pattern)
 from mcp_agent.app import MCPApp
@@ -23,10 +51,21 @@ from mcp_agent.config import (
     OpenAISettings,
 )
 from mcp_agent.agents.agent import Agent
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
 
+# Python MCP servers run on the backend's own interpreter, which already lives in the
+# project environment; going through `uv run` would re-resolve the project on every spawn.
+PYTHON_EXECUTABLE = sys.executable
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Servers that only provide supporting tools (e.g. persistence); they are attached to
+# every per-server agent instead of producing a result of their own.
+SUPPORT_SERVER_NAMES = ["mongodb"]
+
+
+@dataclass(slots=True)
 class ExecutorResult:
     """Result object for parallel executor operations"""
     prompt_name: str
@@ -40,6 +79,65 @@ class ExecutorResult:
         return f"ExecutorResult(prompt='{self.prompt_name}', server='{self.server_name}', status='{self.status}')"
 
 
+# Environment variable holding each provider's default API key
+_PROVIDER_API_KEY_ENV = {
+    "blackbox": "BLACKBOX_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+}
+
+
+@lru_cache(maxsize=16)
+def _resolve_provider_config(provider: str,
+                             model: Optional[str],
+                             base_url: Optional[str],
+                             header_items: Optional[Tuple[Tuple[str, str], ...]]) -> Dict[
+    str, Optional[Union[str, Dict[str, str]]]]:
+    """
+    Resolve provider configuration from the environment, memoized per (provider, model, base_url, headers).
+
+    An explicit api_key is merged in by the caller so it never becomes part of the cache key.
+    """
+    default_headers = dict(header_items) if header_items else None
+    if provider == "blackbox":
+        resolved_base_url = base_url or os.getenv("BLACKBOX_BASE_URL", "https://api.blackbox.ai/v1")
+        resolved_model = model or os.getenv("BLACKBOX_DEFAULT_MODEL", "blackboxai/google/gemini-2.5-pro")
+        resolved_headers = default_headers
+    elif provider == "openai":
+        resolved_base_url = base_url or os.getenv("OPENAI_BASE_URL")
+        resolved_model = model or os.getenv("OPENAI_DEFAULT_MODEL", "gpt-4o")
+        resolved_headers = default_headers
+    elif provider == "openrouter":
+        resolved_base_url = base_url or os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+        resolved_model = model or os.getenv("OPENROUTER_DEFAULT_MODEL", "openrouter/google/gemini-flash-1.5")
+        resolved_headers = _build_openrouter_headers(default_headers)
+    else:
+        raise ValueError(
+            f"Unsupported LLM provider '{provider}'. Supported providers are 'blackbox', 'openai', and 'openrouter'."
+        )
+
+    return {
+        "api_key": os.getenv(_PROVIDER_API_KEY_ENV[provider]),
+        "model": resolved_model,
+        "base_url": resolved_base_url,
+        "default_headers": resolved_headers,
+    }
+
+
+def _build_openrouter_headers(base_headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Compose OpenRouter default headers from env overrides without clobbering explicit values."""
+    headers = dict(base_headers) if base_headers else {}
+    referer = os.getenv("OPENROUTER_HTTP_REFERER")
+    title = os.getenv("OPENROUTER_X_TITLE")
+
+    if referer:
+        headers.setdefault("HTTP-Referer", referer)
+    if title:
+        headers.setdefault("X-Title", title)
+
+    return headers or None
+
+
 class MCPAgentExecutor:
     """
     MCP Agent Executor using mcp-agent library for LLM-powered execution
@@ -50,7 +148,9 @@ class MCPAgentExecutor:
                  model: str = "gpt-5",
                  base_url: Optional[str] = None,
                  provider: Optional[str] = None,
-                 default_headers: Optional[Dict[str, str]] = None):
+                 default_headers: Optional[Dict[str, str]] = None,
+                 max_concurrent: int = 4,
+                 server_timeout: Optional[float] = 300.0):
         """
         Initialize the MCP Agent executor
         
@@ -60,8 +160,10 @@ class MCPAgentExecutor:
             base_url: API base URL for the selected provider
             provider: LLM provider identifier (blackbox, openai, openrouter)
             default_headers: Optional extra HTTP headers for OpenAI-compatible clients
+            max_concurrent: Maximum number of per-server agents run at the same time
+            server_timeout: Seconds a single server's agent may run before it is
+                reported as timed out (None disables the limit)
         """
-        load_dotenv(override=True)
         self.provider = (provider or os.getenv("MCP_LLM_PROVIDER") or "openai").strip().lower()
         self._provider_config = self._resolve_provider_config(
             api_key=api_key,
@@ -74,57 +176,74 @@ class MCPAgentExecutor:
         self.model = self._provider_config["model"]
         self.base_url = self._provider_config["base_url"]
         self.default_headers = self._provider_config.get("default_headers")
+        self.max_concurrent = max_concurrent
+        self.server_timeout = server_timeout
         self.app = None
-
-        # Available MCP servers configuration
+        self._settings = None
+
+        # Persistent app, owned by a dedicated task, so MCP server subprocesses survive
+        # across calls; _in_flight counts the calls currently using it
+        self._agent_app = None
+        self._app_task = None
+        self._app_stop = None
+        self._app_loop = None
+        self._app_state = None
+        self._in_flight = 0
+        self._restart_pending = False
+
+        # Available MCP servers configuration. "env_vars" maps each subprocess env key to
+        # the process env var it is read from; values are resolved when settings are built.
         self._server_config = {
             "blackbox": {
-                "command": "uv",
-                "args": ["run", "python", "servers/bbai_mcp_server/blackbox_mcp_server/server.py"],
+                "command": PYTHON_EXECUTABLE,
+                "args": ["servers/bbai_mcp_server/blackbox_mcp_server/server.py"],
                 "cwd": str(Path(__file__).parent),
-                "env": {"BLACKBOX_API_KEY": os.getenv("BLACKBOX_API_KEY")}
+                "env_vars": {"BLACKBOX_API_KEY": "BLACKBOX_API_KEY"}
             },
             "openai": {
-                "command": "uv",
-                "args": ["run", "python", "servers/openai_mcp_server/server.py"],
+                "command": PYTHON_EXECUTABLE,
+                "args": ["servers/openai_mcp_server/server.py"],
                 "cwd": str(Path(__file__).parent),
-                "env": {"OPENAI_API_KEY": os.getenv("OPENAI_API_KEY")}
+                "env_vars": {"OPENAI_API_KEY": "OPENAI_API_KEY"}
             },
             "bluesky": {
                 "command": "node",
                 "args": ["servers/bsky_mcp_server/build/src/index.js"],
                 "cwd": str(Path(__file__).parent),
-                "env": {"BLUESKY_IDENTIFIER": os.getenv('BLUESKY_IDENTIFIER'),
-                        "BLUESKY_APP_PASSWORD": os.getenv('BLUESKY_APP_PASSWORD'),
-                        "BLUESKY_SERVICE_URL": os.getenv('BLUESKY_SERVICE_URL')}
+                "env_vars": {"BLUESKY_IDENTIFIER": "BLUESKY_IDENTIFIER",
+                             "BLUESKY_APP_PASSWORD": "BLUESKY_APP_PASSWORD",
+                             "BLUESKY_SERVICE_URL": "BLUESKY_SERVICE_URL"}
             },
             "linkedin": {
-                "command": "uv",
-                "args": ["run", "python", "servers/linkedin-mcp/linkedin_mcp/server.py"],
+                "command": PYTHON_EXECUTABLE,
+                "args": ["servers/linkedin-mcp/linkedin_mcp/server.py"],
                 "cwd": str(Path(__file__).parent),
-                "env": {"LINKEDIN_CLIENT_ID": os.getenv("LINKEDIN_CLIENT_ID"),
-                        "LINKEDIN_CLIENT_SECRET": os.getenv("LINKEDIN_CLIENT_SECRET"),
-                        "LINKEDIN_REDIRECT_URI": os.getenv("LINKEDIN_REDIRECT_URI")}
+                "env_vars": {"LINKEDIN_CLIENT_ID": "LINKEDIN_CLIENT_ID",
+                             "LINKEDIN_CLIENT_SECRET": "LINKEDIN_CLIENT_SECRET",
+                             "LINKEDIN_REDIRECT_URI": "LINKEDIN_REDIRECT_URI"}
             },
             "twitter": {
                 "command": "node",
                 "args": ["servers/twitter-mcp/build/index.js"],
                 "cwd": str(Path(__file__).parent),
-                "env": {"API_KEY": os.getenv("API_KEY"),
-                        "API_SECRET_KEY": os.getenv("API_SECRET_KEY"),
-                        "ACCESS_TOKEN": os.getenv("ACCESS_TOKEN"),
-                        "ACCESS_TOKEN_SECRET": os.getenv("ACCESS_TOKEN_SECRET")}
+                "env_vars": {"API_KEY": "API_KEY",
+                             "API_SECRET_KEY": "API_SECRET_KEY",
+                             "ACCESS_TOKEN": "ACCESS_TOKEN",
+                             "ACCESS_TOKEN_SECRET": "ACCESS_TOKEN_SECRET"}
             },
             "mongodb": {
                 "command": "npx",
-                "args": ["-y", "mongodb-mcp-server", "--connectionString",
-                         os.getenv("MONGODB_URI"), ],
+                "args": ["-y", "mongodb-mcp-server", "--connectionString"],
+                # Env vars whose values are appended to args at build time
+                "arg_vars": ["MONGODB_URI"],
                 "cwd": str(Path(__file__).parent),
-                "env": {
-                    "MONGODB_URI": os.getenv("MONGODB_URI"),
-                    "MONGODB_DB_NAME": os.getenv("MONGODB_DB_NAME")}
+                "env_vars": {
+                    "MONGODB_URI": "MONGODB_URI",
+                    "MONGODB_DB_NAME": "MONGODB_DB_NAME"}
             }
         }
+        # Runtime env updates layered over the resolved env_vars, per server
+        self._env_overrides: Dict[str, Dict[str, Optional[str]]] = {}
         self._setup_mcp_app()
 
     def update_server_env(self, env_updates: Dict[str, Optional[str]],
@@ -132,31 +251,59 @@ class MCPAgentExecutor:
         """Refresh MCP server environment variables after runtime updates."""
         target_servers = server_names or list(self._server_config.keys())
 
+        if self.app is None or self._settings is None:
+            needs_rebuild = True
+        else:
+            needs_rebuild = set(self._settings.mcp.servers) != set(self._server_config)
+
+        env_changed = False
         for server_name in target_servers:
             if server_name not in self._server_config:
                 continue
 
-            server_env = self._server_config[server_name].get("env", {})
-            for key, value in env_updates.items():
-                if value is None:
-                    server_env.pop(key, None)
-                else:
-                    server_env[key] = value
-
-        # Rebuild MCP app so new env vars propagate to subprocess configs
-        self._setup_mcp_app()
+            self._env_overrides.setdefault(server_name, {}).update(env_updates)
+
+            if not needs_rebuild:
+                # Patch the live settings entry so the next spawn picks up the new env
+                server_settings = self._settings.mcp.servers[server_name]
+                resolved_env = self._resolve_server_env(server_name)
+                if server_settings.env != resolved_env:
+                    server_settings.env = resolved_env
+                    env_changed = True
+
+        # Only rebuild the MCP app when the configured server set has drifted
+        if needs_rebuild:
+            self._setup_mcp_app()
+        elif env_changed:
+            # Running servers still hold the old env; respawn them before the next call
+            self._restart_pending = True
+
+    def _resolve_server_env(self, server_name: str) -> Dict[str, str]:
+        """Read a server's env from the process environment plus any runtime overrides."""
+        env = {}
+        for key, env_var in self._server_config[server_name]["env_vars"].items():
+            value = os.getenv(env_var)
+            if value is not None:
+                env[key] = value
+
+        for key, value in self._env_overrides.get(server_name, {}).items():
+            if value is None:
+                env.pop(key, None)
+            else:
+                env[key] = value
+        return env
 
     def _setup_mcp_app(self):
         """Setup MCP application with server configurations using Settings"""
         # Build server configurations based on requested servers
-        load_dotenv(override=True)
         mcp_servers = {}
         for server_name, config in self._server_config.items():
+            arg_values = [os.getenv(env_var) for env_var in config.get("arg_vars", [])]
             mcp_servers[server_name] = MCPServerSettings(
                 command=config["command"],
-                args=config["args"],
+                args=[*config["args"], *arg_values],
                 cwd=config["cwd"],
-                env=config["env"]
+                env=self._resolve_server_env(server_name)
             )
 
         # Create settings with MCP server configurations
@@ -176,7 +323,9 @@ class MCPAgentExecutor:
         )
 
         # Initialize MCP app with settings
+        self._settings = settings
         self.app = MCPApp(name="agent_executor", settings=settings)
+        self._restart_pending = True
 
     def _resolve_provider_config(self,
                                  api_key: Optional[str],
@@ -185,54 +334,19 @@ class MCPAgentExecutor:
                                  default_headers: Optional[Dict[str, str]]) -> Dict[
         str, Optional[Union[str, Dict[str, str]]]]:
         """Derive OpenAI-compatible client configuration for the selected provider."""
-        provider = self.provider
-        if provider == "blackbox":
-            resolved_api_key = api_key or os.getenv("BLACKBOX_API_KEY")
-            resolved_base_url = base_url or os.getenv("BLACKBOX_BASE_URL", "https://api.blackbox.ai/v1")
-            resolved_model = model or os.getenv("BLACKBOX_DEFAULT_MODEL", "blackboxai/google/gemini-2.5-pro")
-            resolved_headers = default_headers
-            key_hint = "BLACKBOX_API_KEY"
-        elif provider == "openai":
-            resolved_api_key = api_key or os.getenv("OPENAI_API_KEY")
-            resolved_base_url = base_url or os.getenv("OPENAI_BASE_URL")
-            resolved_model = model or os.getenv("OPENAI_DEFAULT_MODEL", "gpt-4o")
-            resolved_headers = default_headers
-            key_hint = "OPENAI_API_KEY"
-        elif provider == "openrouter":
-            resolved_api_key = api_key or os.getenv("OPENROUTER_API_KEY")
-            resolved_base_url = base_url or os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
-            resolved_model = model or os.getenv("OPENROUTER_DEFAULT_MODEL", "openrouter/google/gemini-flash-1.5")
-            resolved_headers = self._build_openrouter_headers(default_headers)
-            key_hint = "OPENROUTER_API_KEY"
-        else:
-            raise ValueError(
-                f"Unsupported LLM provider '{provider}'. Supported providers are 'blackbox', 'openai', and 'openrouter'."
-            )
-
-        if not resolved_api_key:
+        header_items = tuple(sorted(default_headers.items())) if default_headers else None
+        resolved = _resolve_provider_config(self.provider, model, base_url, header_items)
+        config = dict(resolved)
+        if api_key:
+            config["api_key"] = api_key
+        if not config["api_key"]:
             raise ValueError(
-                f"API key is required for provider '{provider}'. Set the {key_hint} environment variable or pass api_key explicitly."
+                f"API key is required for provider '{self.provider}'. "
+                f"Set the {_PROVIDER_API_KEY_ENV[self.provider]} environment variable or pass api_key explicitly."
             )
-
-        return {
-            "api_key": resolved_api_key,
-            "model": resolved_model,
-            "base_url": resolved_base_url,
-            "default_headers": resolved_headers,
-        }
-
-    def _build_openrouter_headers(self, base_headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
-        """Compose OpenRouter default headers from env overrides without clobbering explicit values."""
-        headers = dict(base_headers) if base_headers else {}
-        referer = os.getenv("OPENROUTER_HTTP_REFERER")
-        title = os.getenv("OPENROUTER_X_TITLE")
-
-        if referer:
-            headers.setdefault("HTTP-Referer", referer)
-        if title:
-            headers.setdefault("X-Title", title)
-
-        return headers or None
+        if config["default_headers"] is not None:
+            config["default_headers"] = dict(config["default_headers"])
+        return config
 
     async def _create_agent(self, server_names: List[str], app_context):
         """Create agent with access to specified servers following precise pattern from llm_agent.py"""
@@ -245,19 +359,133 @@ class MCPAgentExecutor:
             - Create comprehensive content strategies
             
             Always choose the most appropriate tools for each task and explain your actions.""",
-            server_names=server_names
+            server_names=server_names,
+            context=app_context.context
         )
         return agent
 
+    async def _serve_app(self, ready: asyncio.Future, stop: asyncio.Event) -> None:
+        """
+        Own the MCP app for its whole lifetime, entering and exiting it in this one task.
+
+        Per-call agents share the context's connection manager but close it once its
+        reference count drops to zero; the keep-alive aggregator holds a reference of
+        its own, so the server subprocesses stay up until the app is stopped.
+        """
+        try:
+            async with self.app.run() as agent_app:
+                async with MCPAggregator(server_names=[], connection_persistence=True,
+                                         context=agent_app.context, name="executor_keepalive"):
+                    ready.set_result(agent_app)
+                    await stop.wait()
+        except asyncio.CancelledError:
+            ready.cancel()
+            raise
+        except Exception as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+    async def _start_app(self):
+        """Start the owner task and wait until the app is running"""
+        if not self.app:
+            raise RuntimeError("MCP app not initialized")
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._serve_app(ready, stop))
+        try:
+            self._agent_app = await ready
+        except BaseException:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+        self._app_task = task
+        self._app_stop = stop
+        self._restart_pending = False
+
+    async def _stop_app(self):
+        """Signal the owner task to exit the app and wait for its servers to shut down"""
+        task, stop = self._app_task, self._app_stop
+        self._agent_app = None
+        self._app_task = None
+        self._app_stop = None
+        if task is not None:
+            stop.set()
+            # An owner task that already died must not fail the call replacing it
+            (outcome,) = await asyncio.gather(task, return_exceptions=True)
+            if isinstance(outcome, Exception):
+                logger.warning("MCP app exited with an error: %r", outcome)
+
+    def _bind_loop(self) -> asyncio.Condition:
+        """Return the app state condition for the running loop, forgetting an app left on another loop"""
+        loop = asyncio.get_running_loop()
+        if self._app_loop is not loop:
+            # An app owned by a task on another (now closed) loop can neither be reused nor exited
+            self._agent_app = None
+            self._app_task = None
+            self._app_stop = None
+            self._in_flight = 0
+            self._app_loop = loop
+            self._app_state = asyncio.Condition()
+        return self._app_state
+
+    @asynccontextmanager
+    async def _lease(self):
+        """
+        Hold the running MCP app for the duration of a call, starting it if needed.
+
+        A pending restart (e.g. after a server env update) waits until no call holds
+        the old app, and new calls queue behind it rather than joining the old servers.
+        """
+        state = self._bind_loop()
+        async with state:
+            if self._app_task is not None and self._app_task.done():
+                # The owner task exited on its own; collect its error and start afresh
+                self._restart_pending = True
+            if self._restart_pending and self._agent_app is not None:
+                await state.wait_for(lambda: not self._in_flight)
+                await self._stop_app()
+            if self._agent_app is None:
+                await self._start_app()
+            self._in_flight += 1
+            agent_app = self._agent_app
+
+        try:
+            yield agent_app
+        finally:
+            async with state:
+                self._in_flight -= 1
+                state.notify_all()
+
+    async def __aenter__(self) -> "MCPAgentExecutor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def close(self):
+        """Shut down the persistent MCP app and its server subprocesses once in-flight calls finish"""
+        state = self._bind_loop()
+        async with state:
+            await state.wait_for(lambda: not self._in_flight)
+            await self._stop_app()
+
+    async def aclose(self):
+        """Release all long-lived resources held by the executor"""
+        await self.close()
+
     async def cleanup(self):
-        """Clean up resources"""
-        # mcp-agent handles cleanup automatically through context managers
+        """Clean up per-call resources"""
+        # Server connections are kept alive between calls; use close() to tear them down
         pass
 
     async def execute_parallel(self, prompt: str, server_names: List[str],
                                prompt_name: str = "custom_prompt") -> List[ExecutorResult]:
         """
-        Execute prompt across multiple servers using LLM agent following precise llm_agent.py pattern
+        Execute prompt across multiple servers concurrently, one LLM agent per server
+        
+        Support servers (see SUPPORT_SERVER_NAMES) are attached to every agent rather
+        than being run on their own, unless no other server was requested.
         
         Args:
             prompt: The prompt text to send
@@ -267,7 +495,6 @@ class MCPAgentExecutor:
         Returns:
             List of ExecutorResult objects with results from each server
         """
-        import time
         results = []
 
         # Filter to valid server names
@@ -286,37 +513,29 @@ class MCPAgentExecutor:
         if not valid_servers:
             return results
 
+        primary_servers = [name for name in valid_servers if name not in SUPPORT_SERVER_NAMES]
+        if primary_servers:
+            support_servers = [name for name in valid_servers if name in SUPPORT_SERVER_NAMES]
+        else:
+            primary_servers, support_servers = valid_servers, []
+
         start_time = time.time()
 
         try:
-            if not self.app:
-                raise RuntimeError("MCP app not initialized")
-
-            # Run the agent with the user message using modern pattern from llm_agent.py
-            async with self.app.run() as agent_app:
-                agent = await self._create_agent(valid_servers, agent_app)
-
-                # Use the modern attach_llm pattern (settings are already configured in app)
-                async with agent:
-                    llm = await agent.attach_llm(OpenAIAugmentedLLM)
-                    response = await llm.generate_str(prompt)
+            async with self._lease() as agent_app:
+                semaphore = asyncio.Semaphore(self.max_concurrent)
 
-                    execution_time = time.time() - start_time
-
-                    # Create successful result for all requested servers
-                    for server_name in valid_servers:
-                        results.append(ExecutorResult(
-                            prompt_name=prompt_name,
-                            server_name=server_name,
-                            content=response,
-                            status="generated",
-                            execution_time=execution_time
-                        ))
+                # Run one agent per server against the already running MCP servers
+                server_results = await asyncio.gather(*(
+                    self._run_one(prompt, prompt_name, server_name, support_servers, agent_app, semaphore)
+                    for server_name in primary_servers
+                ))
+            results.extend(server_results)
 
         except Exception as e:
             execution_time = time.time() - start_time
-            # If execution fails, create error results for all servers
-            for server_name in valid_servers:
+            # If the app itself fails, create error results for all servers
+            for server_name in primary_servers:
                 results.append(ExecutorResult(
                     prompt_name=prompt_name,
                     server_name=server_name,
@@ -327,6 +546,52 @@ class MCPAgentExecutor:
 
         return results
 
+    async def _run_one(self, prompt: str, prompt_name: str, server_name: str,
+                       support_servers: List[str], agent_app,
+                       semaphore: asyncio.Semaphore) -> ExecutorResult:
+        """Run the prompt through a dedicated agent bound to one server plus any support servers"""
+        async with semaphore:
+            start_time = time.time()
+            try:
+                # Bound each server so one stuck agent cannot stall the whole batch
+                response = await asyncio.wait_for(
+                    self._generate(prompt, [server_name, *support_servers], agent_app),
+                    timeout=self.server_timeout
+                )
+
+                return ExecutorResult(
+                    prompt_name=prompt_name,
+                    server_name=server_name,
+                    content=response,
+                    status="generated",
+                    execution_time=time.time() - start_time
+                )
+            except asyncio.TimeoutError:
+                return ExecutorResult(
+                    prompt_name=prompt_name,
+                    server_name=server_name,
+                    error=f"timeout after {self.server_timeout}s",
+                    status="error",
+                    execution_time=time.time() - start_time
+                )
+            except Exception as e:
+                return ExecutorResult(
+                    prompt_name=prompt_name,
+                    server_name=server_name,
+                    error=str(e),
+                    status="error",
+                    execution_time=time.time() - start_time
+                )
+
+    async def _generate(self, prompt: str, server_names: List[str], agent_app) -> str:
+        """Create an agent bound to the given servers and generate a response"""
+        agent = await self._create_agent(server_names, agent_app)
+
+        # Use the modern attach_llm pattern (settings are already configured in app)
+        async with agent:
+            llm = await agent.attach_llm(OpenAIAugmentedLLM)
+            return await llm.generate_str(prompt)
+
     async def _execute_single_server(self, prompt: str, prompt_name: str, server_name: str) -> ExecutorResult:
         """Execute prompt on a single server using LLM agent pattern"""
         # This method is kept for compatibility but now uses the same agent-based approach
@@ -339,6 +604,15 @@ class MCPAgentExecutor:
         )
 
 
+def run_async(main):
+    """Run a coroutine to completion on uvloop when available, else the stock asyncio loop"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
 # Global executor instance
 _executor = None
 
@@ -353,6 +627,15 @@ def get_executor() -> MCPAgentExecutor:
     return _executor
 
 
+async def shutdown_executor() -> None:
+    """Close the global executor, if any, so its MCP subprocesses and connections are released"""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        await executor.aclose()
+    _is_known_server.cache_clear()
+
+
 def update_mcp_server_env(env_updates: Dict[str, Optional[str]], server_names: Optional[List[str]] = None) -> None:
     """Update environment variables for MCP servers and refresh executor configuration."""
     target_servers = server_names or SOCIAL_SERVER_NAMES
@@ -367,6 +650,9 @@ def update_mcp_server_env(env_updates: Dict[str, Optional[str]], server_names: O
     if _executor is not None:
         _executor.update_server_env(env_updates, target_servers)
 
+    _is_known_server.cache_clear()
+    _resolve_provider_config.cache_clear()
+
 
 async def execute_mcp_client(
         prompt: str,
@@ -469,9 +755,10 @@ def get_error_summary(results: List[ExecutorResult]) -> str:
     Returns:
         String summary of all errors
     """
-    errors = [f"{result.server_name}: {result.error}"
-              for result in results if result.error]
-    return "; ".join(errors) if errors else "No errors"
+    if not any(result.error for result in results):
+        return "No errors"
+    return "; ".join(f"{result.server_name}: {result.error}"
+                     for result in results if result.error)
 
 
 def get_performance_summary(results: List[ExecutorResult]) -> Dict[str, float]:
@@ -484,25 +771,45 @@ def get_performance_summary(results: List[ExecutorResult]) -> Dict[str, float]:
     Returns:
         Dictionary with performance metrics
     """
-    successful = get_successful_results(results)
-    if not successful:
-        return {"total_time": 0, "fastest": 0, "slowest": 0, "average": 0}
+    successful_count = 0
+    timed_count = 0
+    total = 0.0
+    fastest = float("inf")
+    slowest = 0.0
 
-    times = [r.execution_time for r in successful if r.execution_time]
-    if not times:
+    # Single pass over the results instead of filtering and reducing separately
+    for result in results:
+        if not (result.content and result.status == "generated"):
+            continue
+        successful_count += 1
+        execution_time = result.execution_time
+        if not execution_time:
+            continue
+        timed_count += 1
+        total += execution_time
+        if execution_time < fastest:
+            fastest = execution_time
+        if execution_time > slowest:
+            slowest = execution_time
+
+    if not timed_count:
         return {"total_time": 0, "fastest": 0, "slowest": 0, "average": 0}
 
     return {
-        "total_time": max(times),  # Parallel execution time is the slowest
-        "fastest": min(times),
-        "slowest": max(times),
-        "average": sum(times) / len(times),
-        "successful_count": len(successful),
+        "total_time": slowest,  # Parallel execution time is the slowest
+        "fastest": fastest,
+        "slowest": slowest,
+        "average": total / timed_count,
+        "successful_count": successful_count,
         "total_count": len(results)
     }
 
 
+@lru_cache(maxsize=32)
+def _is_known_server(platform: str) -> bool:
+    return platform in get_executor()._server_config
+
+
 def validate_server_by_platform(platform: str) -> bool:
-    executor = get_executor()
-    server = executor._server_config.get(platform.lower())
-    return server is not None
+    return _is_known_server(platform.lower())
+
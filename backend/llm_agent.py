@@ -9,13 +9,12 @@ correctly.
 from __future__ import annotations
 
 import argparse
-import asyncio
 from pathlib import Path
 from typing import List
 
 from dotenv import load_dotenv
 
-from executor import ExecutorResult, execute_mcp_client, get_error_summary
+from executor import ExecutorResult, execute_mcp_client, get_error_summary, run_async
 
 
 DEFAULT_SERVERS = ["mongodb"]
@@ -92,7 +91,7 @@ async def async_main() -> None:
 
 
 def main() -> None:
-    asyncio.run(async_main())
+    run_async(async_main())
 
 
 if __name__ == "__main__":
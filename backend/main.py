@@ -7,6 +7,7 @@ import pymongo
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 import wandb
@@ -17,6 +18,7 @@ from executor import (
     execute_with_fallback,
     get_error_summary,
     get_performance_summary,
+    shutdown_executor,
     update_mcp_server_env,
     validate_server_by_platform,
 )
@@ -99,8 +101,11 @@ async def lifespan(app: FastAPI):
 
     yield  # yield the app to the context manager
 
+    # Code to run on shutdown
+    await shutdown_executor()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -422,16 +427,14 @@ async def approve_and_post_content(content_id: str):
                     detail="Twitter credentials not configured. Please set TWITTER_API_KEY, TWITTER_API_SECRET, TWITTER_ACCESS_TOKEN, and TWITTER_ACCESS_TOKEN_SECRET"
                 )
 
-            # Initialize Twitter client
-            twitter_client = TwitterClient(
+            # Initialize Twitter client and post
+            async with TwitterClient(
                 api_key=api_key,
                 api_secret=api_secret,
                 access_token=access_token,
                 access_token_secret=access_token_secret
-            )
-
-            # Post to Twitter
-            result = await twitter_client.post_tweet(content.content)
+            ) as twitter_client:
+                result = await twitter_client.post_tweet(content.content)
 
             if result["success"]:
                 # Update content status and store Twitter metadata
@@ -471,38 +474,37 @@ async def approve_and_post_content(content_id: str):
                     detail="Bluesky credentials not configured. Please set BLUESKY_IDENTIFIER and BLUESKY_APP_PASSWORD"
                 )
 
-            # Initialize Bluesky client
-            bluesky_client = BlueskyClient(
+            # Initialize Bluesky client; the context closes its connection pool
+            async with BlueskyClient(
                 identifier=identifier,
                 password=password,
                 service_url=service_url
-            )
-
-            # Login to Bluesky
-            if not await bluesky_client.login():
-                raise HTTPException(status_code=401, detail="Failed to login to Bluesky")
-
-            # Post to Bluesky
-            result = await bluesky_client.create_post(content.content)
-
-            if result["success"]:
-                # Update content status and store Bluesky metadata
-                await content_controller.update_by_id(content_id, {
-                    "status": "posted",
-                    "bluesky_uri": result["uri"],
-                    "bluesky_cid": result["cid"],
-                    "posted_at": result["created_at"]
-                })
-
-                return ContentResponse(
-                    id=content_id,
-                    content=f"✅ Posted to Bluesky: {content.content}",
-                    status="posted",
-                    message=f"Successfully posted to Bluesky! URI: {result['uri']}"
-                )
-            else:
-                error_msg = result.get("error", "Unknown error")
-                raise HTTPException(status_code=500, detail=f"Failed to post to Bluesky: {error_msg}")
+            ) as bluesky_client:
+                # Login to Bluesky
+                if not await bluesky_client.login():
+                    raise HTTPException(status_code=401, detail="Failed to login to Bluesky")
+
+                # Post to Bluesky
+                result = await bluesky_client.create_post(content.content)
+
+                if result["success"]:
+                    # Update content status and store Bluesky metadata
+                    await content_controller.update_by_id(content_id, {
+                        "status": "posted",
+                        "bluesky_uri": result["uri"],
+                        "bluesky_cid": result["cid"],
+                        "posted_at": result["created_at"]
+                    })
+
+                    return ContentResponse(
+                        id=content_id,
+                        content=f"✅ Posted to Bluesky: {content.content}",
+                        status="posted",
+                        message=f"Successfully posted to Bluesky! URI: {result['uri']}"
+                    )
+                else:
+                    error_msg = result.get("error", "Unknown error")
+                    raise HTTPException(status_code=500, detail=f"Failed to post to Bluesky: {error_msg}")
 
         except HTTPException:
             raise
@@ -679,17 +681,21 @@ async def get_content_audio(content_id: str):
         # Get content from MongoDB
         content = await content_controller.get_by_id(content_id, raise_if_none=True)
 
-        # Return all audio items from the database
-        if content.audio_content and len(content.audio_content) > 0:
+        # Legacy items are inline base64; GridFS files are served by URL
+        audio_urls = [f"/content/{content_id}/audio/{file_id}" for file_id in content.audio_file_ids]
+        count = len(content.audio_content) + len(audio_urls)
+        if count > 0:
             return {
                 "audio_items": content.audio_content,
-                "count": len(content.audio_content),
+                "audio_urls": audio_urls,
+                "count": count,
                 "format": "mp3",
                 "content_type": "audio/mpeg"
             }
         else:
             return {
                 "audio_items": [],
+                "audio_urls": [],
                 "count": 0,
                 "message": "No audio content available"
             }
@@ -698,6 +704,32 @@ async def get_content_audio(content_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch audio: {str(e)}")
 
 
+@app.get("/content/{content_id}/audio/{file_id}")
+async def stream_content_audio(content_id: str, file_id: str):
+    """Stream an audio file stored in GridFS for a specific content item"""
+    try:
+        content = await content_controller.get_by_id(content_id, raise_if_none=True)
+        if file_id not in content.audio_file_ids:
+            raise HTTPException(status_code=404, detail="Audio file not found")
+
+        grid_out = await content_controller.open_audio(file_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch audio: {str(e)}")
+
+    async def audio_chunks():
+        while chunk := await grid_out.readchunk():
+            yield chunk
+
+    media_type = (grid_out.metadata or {}).get("content_type", "audio/mpeg")
+    return StreamingResponse(
+        audio_chunks(),
+        media_type=media_type,
+        headers={"Content-Length": str(grid_out.length)},
+    )
+
+
 @app.get("/health")
 @app.options("/health")
 async def health_check():
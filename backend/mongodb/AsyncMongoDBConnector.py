@@ -1,10 +1,10 @@
 import os
 from datetime import timezone, datetime
-from typing import List, Dict, Union, Optional
+from typing import AsyncIterable, List, Dict, Union, Optional
 
 from bson import ObjectId
 from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket, AsyncIOMotorGridOut
 from pymongo.errors import PyMongoError
 from pymongo.server_api import ServerApi
 
@@ -138,6 +138,50 @@ class AsyncMongoDBConnector:
         except PyMongoError as e:
             raise Exception(f"Error while deleting document from MongoDB: {e.__repr__()}")
 
+    async def upload_file(self,
+                          chunks: AsyncIterable[bytes],
+                          filename: str,
+                          bucket_name: str = "fs",
+                          file_id: Optional[ObjectId] = None,
+                          metadata: dict = None) -> str:
+        """
+        Stream chunks into a GridFS bucket without buffering the whole file.
+        """
+        file_id = file_id or ObjectId()
+        bucket = AsyncIOMotorGridFSBucket(self.client[self.database_name], bucket_name=bucket_name)
+        grid_in = bucket.open_upload_stream_with_id(file_id, filename, metadata=metadata)
+        try:
+            async for chunk in chunks:
+                await grid_in.write(chunk)
+        except BaseException:
+            await grid_in.abort()
+            raise
+        try:
+            await grid_in.close()
+            return str(file_id)
+        except PyMongoError as e:
+            raise Exception(f"Error while uploading file to GridFS: {e.__repr__()}")
+
+    async def open_file(self, file_id: str, bucket_name: str = "fs") -> AsyncIOMotorGridOut:
+        """
+        Open a GridFS file for chunked reading.
+        """
+        try:
+            bucket = AsyncIOMotorGridFSBucket(self.client[self.database_name], bucket_name=bucket_name)
+            return await bucket.open_download_stream(ObjectId(file_id))
+        except PyMongoError as e:
+            raise Exception(f"Error while opening file from GridFS: {e.__repr__()}")
+
+    async def delete_file(self, file_id: str, bucket_name: str = "fs") -> None:
+        """
+        Delete a GridFS file and its chunks.
+        """
+        try:
+            bucket = AsyncIOMotorGridFSBucket(self.client[self.database_name], bucket_name=bucket_name)
+            await bucket.delete(ObjectId(file_id))
+        except PyMongoError as e:
+            raise Exception(f"Error while deleting file from GridFS: {e.__repr__()}")
+
     @staticmethod
     def _preprocess(query: dict) -> dict:
         if query and query.get('_id') and type(query['_id']) not in [ObjectId]:
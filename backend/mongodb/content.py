@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict, Any
+from typing import AsyncIterable, List, Dict, Any
 
 from bson import ObjectId
 from dotenv import load_dotenv
@@ -28,6 +28,7 @@ class ContentModel(MongoModel):
     image_content: List[str] = Field(default_factory=list)
     video_content: List[str] = Field(default_factory=list)
     audio_content: List[str] = Field(default_factory=list)
+    audio_file_ids: List[str] = Field(default_factory=list)  # GridFS ids in the "audio" bucket
 
     class Config:
         # Allow extra fields that aren't defined in the model
@@ -66,6 +67,18 @@ class ContentController:
     async def update_by_id(self, content_id: str, update: dict):
         return await self.mongodb.update_one_document({"_id": ObjectId(content_id)}, update, "$set")
 
+    async def upload_audio(self, chunks: AsyncIterable[bytes], filename: str, content_type: str,
+                           file_id: str = None) -> str:
+        return await self.mongodb.upload_file(chunks, filename, bucket_name="audio",
+                                              file_id=ObjectId(file_id) if file_id else None,
+                                              metadata={"content_type": content_type})
+
+    async def open_audio(self, file_id: str):
+        return await self.mongodb.open_file(file_id, bucket_name="audio")
+
+    async def delete_audio(self, file_id: str) -> None:
+        await self.mongodb.delete_file(file_id, bucket_name="audio")
+
 
 load_dotenv()
 content_controller = ContentController()
@@ -11,6 +11,9 @@ class Config:
         load_dotenv()
         self.api_key = self._get_api_key()
         self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+        self.http_transport = os.getenv("OPENAI_HTTP_TRANSPORT", "httpx").strip().lower()
+        if self.http_transport not in ("httpx", "aiohttp"):
+            raise ValueError("OPENAI_HTTP_TRANSPORT must be either 'httpx' or 'aiohttp'")
         timeout_env = os.getenv("OPENAI_TIMEOUT", "120")
         try:
             self.timeout = float(timeout_env)
@@ -19,6 +22,25 @@ class Config:
                 "OPENAI_TIMEOUT must be a numeric value representing seconds"
             )
 
+        max_concurrency_env = os.getenv("OPENAI_MAX_CONCURRENCY", "20")
+        try:
+            self.max_concurrency = int(max_concurrency_env)
+        except ValueError:
+            raise ValueError(
+                "OPENAI_MAX_CONCURRENCY must be an integer number of in-flight requests"
+            )
+        if self.max_concurrency < 1:
+            raise ValueError("OPENAI_MAX_CONCURRENCY must be at least 1")
+
+        try:
+            self.text_cache_ttl = float(os.getenv("OPENAI_TEXT_CACHE_TTL", "3600"))
+            self.text_cache_size = int(os.getenv("OPENAI_TEXT_CACHE_SIZE", "4096"))
+        except ValueError:
+            raise ValueError(
+                "OPENAI_TEXT_CACHE_TTL must be numeric seconds and "
+                "OPENAI_TEXT_CACHE_SIZE an integer entry count"
+            )
+
     def _get_api_key(self) -> str:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
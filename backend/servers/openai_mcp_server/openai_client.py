@@ -1,50 +1,70 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 import httpx
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 from config import config
 
+AUDIO_CHUNK_SIZE = 64 * 1024
+_TEXT_ITEM_TYPES = frozenset({"output_text", "text"})
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+_RATE_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+)
 
-class Message(BaseModel):
+
+def _parse_reset_duration(value: str) -> float:
+    """Convert OpenAI reset headers such as '1s', '20ms' or '6m0s' into seconds."""
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in _DURATION_PART.findall(value))
+
+
+class MessageDict(TypedDict):
     role: str
     content: str
 
-    def to_payload(self) -> Dict[str, Any]:
-        return {"role": self.role, "content": self.content}
-
 
-class TextRequest(BaseModel):
+# TextRequest is a plain dataclass and messages stay plain dicts: their shape is
+# validated once at the MCP tool boundary, so re-wrapping each message is wasted work.
+@dataclass(slots=True)
+class TextRequest:
     model: str
-    messages: List[Message]
+    messages: List[MessageDict]
     temperature: Optional[float] = None
     top_p: Optional[float] = None
-    max_output_tokens: Optional[int] = Field(default=None, ge=1)
+    max_output_tokens: Optional[int] = None
     stream: bool = False
     instructions: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if self.max_output_tokens is not None and self.max_output_tokens < 1:
+            raise ValueError("max_output_tokens must be at least 1")
+
     def to_payload(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": self.model,
-            "input": [message.to_payload() for message in self.messages],
+            "input": [{"role": message["role"], "content": message["content"]} for message in self.messages],
         }
-
-        if self.temperature is not None:
-            payload["temperature"] = self.temperature
-        if self.top_p is not None:
-            payload["top_p"] = self.top_p
-        if self.max_output_tokens is not None:
-            payload["max_output_tokens"] = self.max_output_tokens
+        optional = (
+            ("temperature", self.temperature),
+            ("top_p", self.top_p),
+            ("max_output_tokens", self.max_output_tokens),
+        )
+        payload.update({key: value for key, value in optional if value is not None})
         if self.instructions:
             payload["instructions"] = self.instructions
         if self.stream:
-            payload["stream"] = self.stream
-
+            payload["stream"] = True
         return payload
 
 
@@ -75,22 +95,95 @@ class AudioRequest(BaseModel):
         return payload
 
 
+class SpeechStreamError(Exception):
+    """The TTS response body failed part-way through being read."""
+
+
+class SpeechStream:
+    """Body of a streaming TTS response, counting bytes as they are consumed."""
+
+    __slots__ = ("content_type", "format", "size_bytes", "_response")
+
+    def __init__(self, response: httpx.Response) -> None:
+        self.content_type = response.headers.get("content-type", "audio/mpeg")
+        self.format = OpenAIClient._extension_for_content_type(self.content_type).lstrip(".")
+        self.size_bytes = 0
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.aiter_bytes(chunk_size=AUDIO_CHUNK_SIZE):
+                self.size_bytes += len(chunk)
+                yield chunk
+        except httpx.HTTPError as exc:
+            raise SpeechStreamError(f"OpenAI speech stream failed: {exc}") from exc
+
+
 class OpenAIClient:
     """Thin wrapper around OpenAI's REST API for MCP tooling."""
 
     def __init__(self) -> None:
         headers = {"Content-Type": "application/json", **config.auth_header}
+        if config.http_transport == "aiohttp":
+            transport_kwargs: Dict[str, Any] = {"transport": self._aiohttp_transport()}
+        else:
+            transport_kwargs = {
+                "http2": True,
+                # Keep every pooled connection alive between bursts so back-to-back tool
+                # calls reuse warm sockets instead of re-handshaking
+                "limits": httpx.Limits(
+                    max_keepalive_connections=50,
+                    max_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+            }
         self.client = httpx.AsyncClient(
             base_url=config.base_url,
-            timeout=config.timeout,
+            # Read/write follow OPENAI_TIMEOUT; connecting and pool waits fail fast
+            timeout=httpx.Timeout(config.timeout, connect=10.0, pool=5.0),
             headers=headers,
+            **transport_kwargs,
         )
+        # Monotonic deadline until which the account's request/token budget is exhausted
+        self._rate_limited_until = 0.0
+
+    @staticmethod
+    def _aiohttp_transport() -> httpx.AsyncBaseTransport:
+        """aiohttp-backed transport for heavily concurrent workloads (OPENAI_HTTP_TRANSPORT=aiohttp)."""
+        try:
+            import aiohttp
+            from httpx_aiohttp import AiohttpTransport
+        except ImportError as exc:
+            raise ValueError(
+                "OPENAI_HTTP_TRANSPORT=aiohttp requires the 'aiohttp' extra "
+                "(httpx-aiohttp) to be installed"
+            ) from exc
+
+        # The session is created lazily so it binds to the event loop serving requests
+        return AiohttpTransport(
+            client=lambda: aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    force_close=False,
+                ),
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+        )
+
+    async def __aenter__(self) -> "OpenAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
     async def create_text_response(self, request: TextRequest) -> Dict[str, Any]:
         try:
-            response = await self.client.post("/responses", json=request.to_payload())
+            response = await self.client.post("/responses", content=orjson.dumps(request.to_payload()))
+            self._record_rate_limits(response)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return {"text": self._extract_text(data), "raw": data}
         except httpx.HTTPStatusError as exc:
             raise Exception(self._format_error(exc)) from exc
@@ -99,56 +192,104 @@ class OpenAIClient:
 
     async def generate_image(self, request: ImageRequest) -> Dict[str, Any]:
         try:
-            response = await self.client.post("/images/generations", json=request.to_payload(), timeout=90)
+            response = await self.client.post(
+                "/images/generations", content=orjson.dumps(request.to_payload())
+            )
+            self._record_rate_limits(response)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as exc:
             raise Exception(self._format_error(exc)) from exc
         except Exception as exc:
             raise Exception(f"OpenAI image generation failed: {exc}") from exc
 
-    async def generate_speech(self, request: AudioRequest) -> Dict[str, Any]:
+    @asynccontextmanager
+    async def stream_speech(self, request: AudioRequest) -> AsyncIterator[SpeechStream]:
+        """Open a TTS response; its body is read from the yielded stream before exit."""
+        opened = False
         try:
-            response = await self.client.post("/audio/speech", json=request.to_payload(), timeout=90)
-            response.raise_for_status()
-            audio_bytes = response.content
-            content_type = response.headers.get("content-type", "audio/mpeg")
-            temp_path = self._persist_audio(audio_bytes, content_type)
-            return {
-                "file_path": str(temp_path),
-                "format": temp_path.suffix.lstrip("."),
-                "content_type": content_type,
-                "size_bytes": len(audio_bytes),
-                "storage": "local_temp",
-            }
+            async with self.client.stream(
+                "POST", "/audio/speech", content=orjson.dumps(request.to_payload())
+            ) as response:
+                self._record_rate_limits(response)
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                opened = True
+                yield SpeechStream(response)
         except httpx.HTTPStatusError as exc:
             raise Exception(self._format_error(exc)) from exc
         except Exception as exc:
+            if opened:
+                raise
             raise Exception(f"OpenAI speech synthesis failed: {exc}") from exc
 
+    async def wait_for_rate_limit(self) -> None:
+        """Sleep until the last observed rate-limit window resets, if it was exhausted."""
+        delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _record_rate_limits(self, response: httpx.Response) -> None:
+        headers = response.headers
+        for remaining_header, reset_header in _RATE_LIMIT_HEADERS:
+            remaining = headers.get(remaining_header)
+            reset = headers.get(reset_header)
+            if remaining is None or reset is None:
+                continue
+            try:
+                exhausted = int(remaining) <= 0
+            except ValueError:
+                continue
+            if exhausted:
+                deadline = time.monotonic() + _parse_reset_duration(reset)
+                self._rate_limited_until = max(self._rate_limited_until, deadline)
+
+    async def check_connection(self) -> None:
+        """Authenticated model listing: proves reachability and key validity without spending tokens."""
+        try:
+            response = await self.client.get("/models")
+            self._record_rate_limits(response)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise Exception(self._format_error(exc)) from exc
+        except httpx.HTTPError as exc:
+            raise Exception(f"OpenAI connection check failed: {exc}") from exc
+
+    async def warmup(self) -> None:
+        """Open a pooled connection ahead of the first real request."""
+        try:
+            await self.client.get("/models")
+        except httpx.HTTPError:
+            # Warm-up is best effort; real requests surface connectivity errors
+            pass
+
     async def close(self) -> None:
         await self.client.aclose()
 
     @staticmethod
     def _extract_text(payload: Dict[str, Any]) -> str:
-        outputs: List[str] = []
-        for item in payload.get("output", []):
-            if item.get("type") == "message":
-                for content in item.get("content", []):
+        return "".join(OpenAIClient._iter_texts(payload)).strip()
+
+    @staticmethod
+    def _iter_texts(payload: Dict[str, Any]) -> Iterator[str]:
+        for item in payload.get("output", ()):
+            item_type = item.get("type")
+            if item_type == "message":
+                for content in item.get("content", ()):
                     text = content.get("text") or content.get("output_text")
                     if text:
-                        outputs.append(text)
-            elif item.get("type") in {"output_text", "text"}:
-                text_value = item.get("text") or item.get("output_text")
-                if text_value:
-                    outputs.append(text_value)
-        return "".join(outputs).strip()
+                        yield text
+            elif item_type in _TEXT_ITEM_TYPES:
+                text = item.get("text") or item.get("output_text")
+                if text:
+                    yield text
 
     @staticmethod
     def _format_error(exc: httpx.HTTPStatusError) -> str:
         detail = None
         try:
-            detail = exc.response.json()
+            detail = orjson.loads(exc.response.content)
         except ValueError:
             detail = exc.response.text
         return (
@@ -156,18 +297,6 @@ class OpenAIClient:
             f"{exc.response.status_code} - {detail}"
         )
 
-    @staticmethod
-    def _persist_audio(audio_bytes: bytes, content_type: str) -> Path:
-        try:
-            temp_dir = Path(tempfile.gettempdir()) / "openai_mcp_audio"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            suffix = OpenAIClient._extension_for_content_type(content_type)
-            temp_path = temp_dir / f"openai_speech_{uuid4().hex}{suffix}"
-            temp_path.write_bytes(audio_bytes)
-            return temp_path
-        except OSError as exc:
-            raise Exception(f"Failed to persist audio to temp storage: {exc}") from exc
-
     @staticmethod
     def _extension_for_content_type(content_type: str) -> str:
         mapping = {
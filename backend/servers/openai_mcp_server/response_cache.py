@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+
+class TextResponseCache:
+    """Exact-match TTL/LRU cache for OpenAI text responses keyed by request payload."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    @staticmethod
+    def key_for(payload: Dict[str, Any]) -> bytes:
+        return hashlib.blake2b(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
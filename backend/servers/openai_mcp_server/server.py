@@ -1,36 +1,58 @@
 from __future__ import annotations
 
+import asyncio
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 from fastmcp import FastMCP
 
 from config import config
+from openai_client import MessageDict, client
 from tools import AudioTools, ImageTools, ModelTools, TextTools
 
 
+@asynccontextmanager
+async def lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    # Establish the TLS connection to OpenAI while the MCP handshake is in flight
+    warmup_task = asyncio.create_task(client.warmup())
+    try:
+        yield {}
+    finally:
+        warmup_task.cancel()
+        # STDIO transport serves a single session per process, so release the pool here
+        await client.close()
+
+
 mcp = FastMCP(
     name="OpenAI MCP Server",
     instructions="Expose OpenAI text, image, and audio generation capabilities via MCP tools.",
+    lifespan=lifespan,
 )
 
 
 @mcp.tool
 async def openai_chat(
     model: str,
-    messages: List[Dict[str, str]],
-    temperature: Optional[float] = None,
-    top_p: Optional[float] = None,
-    max_output_tokens: Optional[int] = None,
-    instructions: Optional[str] = None,
+    messages: list[MessageDict],
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_output_tokens: int | None = None,
+    instructions: str | None = None,
     stream: bool = False,
-    repository: Optional[str] = None,
-    commit_sha: Optional[str] = None,
-    branch: Optional[str] = None,
-    summary: Optional[str] = None,
+    repository: str | None = None,
+    commit_sha: str | None = None,
+    branch: str | None = None,
+    summary: str | None = None,
     persist_to_db: bool = True,
-) -> Dict[str, Any]:
-    """Generate text using OpenAI's Responses API and automatically persist to MongoDB. Returns MongoDB document ID and generated text."""
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Generate text using OpenAI's Responses API and automatically persist to MongoDB. Returns MongoDB document ID and generated text. Set use_cache=False to skip reusing an identical earlier response."""
+
+    if not messages:
+        raise ValueError("At least one message is required")
 
     return await TextTools.generate_text(
         model=model,
@@ -45,20 +67,24 @@ async def openai_chat(
         branch=branch or "unknown",
         summary=summary or "Text content generated via OpenAI",
         persist_to_db=persist_to_db,
+        use_cache=use_cache,
     )
 
 
 @mcp.tool
 async def openai_image(
     prompt: str,
-    model: Optional[str] = None,
-    repository: Optional[str] = None,
-    commit_sha: Optional[str] = None,
-    branch: Optional[str] = None,
-    summary: Optional[str] = None,
-) -> Dict[str, Any]:
+    model: str | None = None,
+    repository: str | None = None,
+    commit_sha: str | None = None,
+    branch: str | None = None,
+    summary: str | None = None,
+) -> dict[str, Any]:
     """Generate one or more images through OpenAI's image generation endpoint and automatically persist to MongoDB. Returns MongoDB document ID and image URLs."""
 
+    if not prompt:
+        raise ValueError("Image prompt must not be empty")
+
     return await ImageTools.generate_image(
         prompt=prompt,
         model=model,
@@ -74,13 +100,16 @@ async def openai_speech(
     text: str,
     model: str,
     voice: str,
-    repository: Optional[str] = None,
-    commit_sha: Optional[str] = None,
-    branch: Optional[str] = None,
-    summary: Optional[str] = None,
-) -> Dict[str, Any]:
+    repository: str | None = None,
+    commit_sha: str | None = None,
+    branch: str | None = None,
+    summary: str | None = None,
+) -> dict[str, Any]:
     """Synthesize speech audio and automatically persist it to MongoDB. Returns MongoDB document ID and metadata."""
 
+    if not text:
+        raise ValueError("Input text for speech synthesis must not be empty")
+
     return await AudioTools.generate_speech(
         text=text,
         model=model,
@@ -93,36 +122,68 @@ async def openai_speech(
 
 
 @mcp.tool
-async def openai_models(model_type: Optional[str] = None) -> Dict[str, Any]:
+async def openai_models(model_type: str | None = None) -> dict[str, Any]:
     """Return a curated list of frequently used OpenAI models grouped by modality."""
 
     return await ModelTools.list_models(model_type)
 
 
-@mcp.tool
-async def test_connection() -> Dict[str, Any]:
-    """Validate OpenAI connectivity by issuing a lightweight chat request."""
+# Successful connection checks are reused for this long so polling health checks stay local
+_CONNECTION_CHECK_TTL = 30.0
+_connection_ok_until = 0.0
 
-    try:
-        ping_response = await TextTools.generate_text(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": "Reply with OK"}],
-            max_output_tokens=8,
-            temperature=0.0,
-            persist_to_db=False,  # Don't persist test messages
-        )
+
+@mcp.tool
+async def test_connection(deep: bool = False) -> dict[str, Any]:
+    """Validate OpenAI connectivity with an authenticated model listing; deep=True issues a lightweight chat request instead."""
+
+    global _connection_ok_until
+    if deep:
+        try:
+            ping_response = await TextTools.generate_text(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "Reply with OK"}],
+                max_output_tokens=8,
+                temperature=0.0,
+                persist_to_db=False,  # Don't persist test messages
+                use_cache=False,
+            )
+            return {
+                "status": "success",
+                "message": "Connection to OpenAI API successful",
+                "api_key_present": True,
+                "test_response": ping_response,
+            }
+        except Exception as exc:
+            return {
+                "status": "error",
+                "message": f"Connection failed: {exc}",
+                "api_key_present": bool(config.api_key),
+            }
+
+    if time.monotonic() < _connection_ok_until:
         return {
             "status": "success",
             "message": "Connection to OpenAI API successful",
             "api_key_present": True,
-            "test_response": ping_response,
+            "cached": True,
         }
+
+    try:
+        await client.check_connection()
     except Exception as exc:
         return {
             "status": "error",
             "message": f"Connection failed: {exc}",
             "api_key_present": bool(config.api_key),
         }
+    _connection_ok_until = time.monotonic() + _CONNECTION_CHECK_TTL
+    return {
+        "status": "success",
+        "message": "Connection to OpenAI API successful",
+        "api_key_present": True,
+        "cached": False,
+    }
 
 
 def main() -> None:
@@ -130,7 +191,12 @@ def main() -> None:
         print("Starting OpenAI MCP Server...", file=sys.stderr)
         print(f"API Key configured: {'Yes' if config.api_key else 'No'}", file=sys.stderr)
         print(f"Base URL: {config.base_url}", file=sys.stderr)
-        mcp.run()
+        try:
+            import uvloop
+        except ImportError:  # Windows, or uvloop not installed
+            mcp.run()
+        else:
+            uvloop.run(mcp.run_async())
     except Exception as exc:
         print(f"Failed to start OpenAI MCP server: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -1,98 +1,191 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import io
 import sys
+from collections.abc import Awaitable
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any
 
 # Add parent directory to path for mongodb imports
 backend_dir = Path(__file__).parent.parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
+from bson import ObjectId
+
+from config import config
 from openai_client import (
     AudioRequest,
     ImageRequest,
-    Message,
+    MessageDict,
+    SpeechStreamError,
     TextRequest,
     client,
 )
-from mongodb.content import content_controller, ContentModel
-
-
+from response_cache import TextResponseCache
+
+# Static model catalogue served by ModelTools; tuples keep the groups read-only
+_MODELS_BY_TYPE: dict[str, tuple[dict[str, str], ...]] = {
+    "text": (
+        {"id": "gpt-4o", "description": "Default GPT-4o flagship model"},
+        {"id": "gpt-4.1", "description": "Latest GPT-4.1 reasoning model"},
+        {"id": "gpt-4o-mini", "description": "Cost-efficient fast GPT-4o variant"},
+    ),
+    "image": (
+        {"id": "gpt-image-1", "description": "Latest multimodal image generator"},
+        {"id": "dall-e-3", "description": "High quality illustration model"},
+    ),
+    "audio": (
+        {"id": "gpt-4o-mini-tts", "description": "Text-to-speech voice generation"},
+        {"id": "tts-1-hd", "description": "Studio-grade text-to-speech"},
+    ),
+}
+
+# Identical text requests are answered from memory (OPENAI_TEXT_CACHE_TTL=0 disables)
+_TEXT_CACHE = TextResponseCache(maxsize=config.text_cache_size, ttl=config.text_cache_ttl)
+
+# Identical non-streaming requests already on the wire share one OpenAI call
+_TEXT_IN_FLIGHT: dict[bytes, asyncio.Future] = {}
+
+# Caps in-flight OpenAI requests from this server (OPENAI_MAX_CONCURRENCY)
+_OPENAI_SEM = asyncio.Semaphore(config.max_concurrency)
+
+
+@lru_cache(maxsize=1)
+def _content_store():
+    # Deferred until the first persist: importing mongodb.content pulls in motor and
+    # opens a client, which tool-less sessions and persist_to_db=False never need
+    from mongodb import content
+
+    return content
+
+
+def _content_record(
+    platform: str,
+    content: str,
+    repository: str,
+    commit_sha: str,
+    branch: str,
+    summary: str,
+    **media: list[str],
+):
+    """Build the ContentModel every tool persists; media lists not given stay empty."""
+    return _content_store().ContentModel(
+        repository=repository,
+        commit_sha=commit_sha,
+        branch=branch,
+        summary=summary,
+        timestamp=_utc_now_iso(),
+        platform=platform,
+        status="generated",
+        content=content,
+        **media,
+    )
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class PersistError(Exception):
+    """A generated result could not be written to MongoDB."""
+
+
+async def _persist(
+    kind: str,
+    operation: Awaitable[Any],
+    source_errors: tuple[type[Exception], ...] = (),
+) -> Any:
+    # The connector re-raises driver errors as plain Exception, so only the awaited
+    # MongoDB call itself is wrapped; ContentModel construction errors surface as-is,
+    # as do source_errors raised by the data being written (e.g. an OpenAI stream)
+    try:
+        return await operation
+    except source_errors:
+        raise
+    except Exception as exc:
+        raise PersistError(f"Failed to persist {kind} to MongoDB: {exc}") from exc
+
+
+async def _call_openai(method, request):
+    async with _OPENAI_SEM:
+        await client.wait_for_rate_limit()
+        return await method(request)
+
+
+async def _fetch_text_response(cache_key: bytes | None, request: TextRequest) -> dict[str, Any]:
+    if cache_key is None:
+        return await _call_openai(client.create_text_response, request)
+
+    shared = _TEXT_IN_FLIGHT.get(cache_key)
+    if shared is None:
+        shared = asyncio.ensure_future(_call_openai(client.create_text_response, request))
+        _TEXT_IN_FLIGHT[cache_key] = shared
+
+        def _settle(task: asyncio.Future) -> None:
+            _TEXT_IN_FLIGHT.pop(cache_key, None)
+            if not task.cancelled() and task.exception() is None and task.result().get("text"):
+                _TEXT_CACHE.set(cache_key, task.result())
+
+        shared.add_done_callback(_settle)
+
+    # Shielded so one caller giving up doesn't cancel the call for the others
+    return await asyncio.shield(shared)
+
+
+# Inputs are validated by the MCP tool wrappers in server.py (and FastMCP's argument
+# model for MessageDict keys) before reaching these helpers.
 class TextTools:
     @staticmethod
     async def generate_text(
         model: str,
-        messages: List[Dict[str, str]],
-        temperature: Optional[float] = None,
-        top_p: Optional[float] = None,
-        max_output_tokens: Optional[int] = None,
-        instructions: Optional[str] = None,
+        messages: list[MessageDict],
+        temperature: float | None = None,
+        top_p: float | None = None,
+        max_output_tokens: int | None = None,
+        instructions: str | None = None,
         stream: bool = False,
         repository: str = "unknown",
         commit_sha: str = "unknown",
         branch: str = "unknown",
         summary: str = "Text content generated via OpenAI",
         persist_to_db: bool = True,
-    ) -> Dict[str, Any]:
-        try:
-            message_models = [Message(role=msg["role"], content=msg["content"]) for msg in messages]
-        except KeyError as exc:
-            raise ValueError("Each message must include 'role' and 'content' keys") from exc
-
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
         request = TextRequest(
             model=model,
-            messages=message_models,
+            messages=messages,
             temperature=temperature,
             top_p=top_p,
             max_output_tokens=max_output_tokens,
             instructions=instructions,
             stream=stream,
         )
-        response = await client.create_text_response(request)
+        # Streaming requests, and ones that explicitly ask for sampling variety, always
+        # go to OpenAI; persistence below still runs per call
+        sampling = (temperature is not None and temperature > 0) or (top_p is not None and top_p < 1)
+        cache_key = None
+        response = None
+        if use_cache and not stream and not sampling:
+            payload = request.to_payload()
+            if persist_to_db:
+                # A different commit gets its own generation rather than a copy
+                payload = {**payload, "commit_sha": commit_sha}
+            cache_key = _TEXT_CACHE.key_for(payload)
+            response = _TEXT_CACHE.get(cache_key)
+
+        if response is None:
+            response = await _fetch_text_response(cache_key, request)
         if not response.get("text"):
             raise Exception("No text returned by OpenAI response")
 
         generated_text = response["text"]
 
         # Optionally persist to MongoDB
-        if persist_to_db:
-            try:
-                from datetime import datetime, timezone
-
-                # Create a summary of the conversation for content field
-                conversation_summary = "\n".join([f"{msg['role']}: {msg['content']}" for msg in messages])
-
-                content = ContentModel(
-                    repository=repository,
-                    commit_sha=commit_sha,
-                    branch=branch,
-                    summary=summary,
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                    platform="openai_text",
-                    status="generated",
-                    content=f"{conversation_summary}\n\nGenerated Response:\n{generated_text}",
-                    image_content=[],
-                    audio_content=[],
-                    video_content=[],
-                )
-
-                # Store in MongoDB
-                content_id = await content_controller.create(content)
-
-                return {
-                    "content_id": content_id,
-                    "text": generated_text,
-                    "model": model,
-                    "storage": "mongodb",
-                    "message_count": len(messages),
-                    "response_length": len(generated_text),
-                }
-
-            except Exception as exc:
-                raise Exception(f"Failed to persist text to MongoDB: {exc}") from exc
-        else:
+        if not persist_to_db:
             # Return just the text for backward compatibility
             return {
                 "text": generated_text,
@@ -100,20 +193,38 @@ class TextTools:
                 "storage": "none",
             }
 
+        # Write the transcript and response in one pass for the content field
+        buffer = io.StringIO()
+        buffer.writelines(f"{msg['role']}: {msg['content']}\n" for msg in messages)
+        buffer.write(f"\nGenerated Response:\n{generated_text}")
+
+        content = _content_record(
+            "openai_text", buffer.getvalue(), repository, commit_sha, branch, summary
+        )
+
+        # Store in MongoDB
+        content_id = await _persist("text", _content_store().content_controller.create(content))
+
+        return {
+            "content_id": content_id,
+            "text": generated_text,
+            "model": model,
+            "storage": "mongodb",
+            "message_count": len(messages),
+            "response_length": len(generated_text),
+        }
+
 
 class ImageTools:
     @staticmethod
     async def generate_image(
         prompt: str,
-        model: Optional[str] = None,
+        model: str | None = None,
         repository: str = "unknown",
         commit_sha: str = "unknown",
         branch: str = "unknown",
         summary: str = "Image content generated via OpenAI",
-    ) -> Dict[str, Any]:
-        if not prompt:
-            raise ValueError("Image prompt must not be empty")
-
+    ) -> dict[str, Any]:
         request = ImageRequest(
             prompt=prompt,
             model=model,
@@ -121,49 +232,30 @@ class ImageTools:
         )
 
         # Generate image
-        result = await client.generate_image(request)
+        result = await _call_openai(client.generate_image, request)
 
         # Extract image URLs from response
-        try:
-            image_urls = []
-            if result.get("data"):
-                for item in result["data"]:
-                    if item.get("url"):
-                        image_urls.append(item["url"])
-
-            if not image_urls:
-                raise Exception("No image URLs returned in response")
-
-            # Create content model for MongoDB
-            from datetime import datetime, timezone
-            content = ContentModel(
-                repository=repository,
-                commit_sha=commit_sha,
-                branch=branch,
-                summary=summary,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                platform="openai_image",
-                status="generated",
-                content=prompt,  # Original prompt
-                image_content=image_urls,
-                audio_content=[],
-                video_content=[],
-            )
-
-            # Store in MongoDB
-            content_id = await content_controller.create(content)
+        image_urls = [item["url"] for item in result.get("data") or () if item.get("url")]
+        if not image_urls:
+            raise Exception("No image URLs returned in response")
+
+        # Create content model for MongoDB, keeping the original prompt as content
+        content = _content_record(
+            "openai_image", prompt, repository, commit_sha, branch, summary,
+            image_content=image_urls,
+        )
 
-            return {
-                "content_id": content_id,
-                "image_urls": image_urls,
-                "prompt": prompt,
-                "model": model or "default",
-                "storage": "mongodb",
-                "image_count": len(image_urls),
-            }
+        # Store in MongoDB
+        content_id = await _persist("image", _content_store().content_controller.create(content))
 
-        except Exception as exc:
-            raise Exception(f"Failed to persist image to MongoDB: {exc}") from exc
+        return {
+            "content_id": content_id,
+            "image_urls": image_urls,
+            "prompt": prompt,
+            "model": model or "default",
+            "storage": "mongodb",
+            "image_count": len(image_urls),
+        }
 
 
 class AudioTools:
@@ -176,82 +268,61 @@ class AudioTools:
         commit_sha: str = "unknown",
         branch: str = "unknown",
         summary: str = "Audio content generated via OpenAI TTS",
-    ) -> Dict[str, Any]:
-        if not text:
-            raise ValueError("Input text for speech synthesis must not be empty")
-
+    ) -> dict[str, Any]:
         request = AudioRequest(
             input=text,
             model=model,
             voice=voice,
         )
 
-        # Generate audio file
-        result = await client.generate_speech(request)
-
-        # Read the audio file and encode as base64 for MongoDB storage
+        # The file id is fixed up front so the filename can carry it
+        audio_file_id = str(ObjectId())
+        content_controller = _content_store().content_controller
+
+        # Hold the OpenAI slot while the response body streams straight into GridFS;
+        # a failed upload is aborted by the connector, leaving no partial file
+        async with _OPENAI_SEM:
+            await client.wait_for_rate_limit()
+            async with client.stream_speech(request) as speech:
+                await _persist("audio", content_controller.upload_audio(
+                    speech,
+                    filename=f"openai_speech_{audio_file_id}.{speech.format}",
+                    content_type=speech.content_type,
+                    file_id=audio_file_id,
+                ), source_errors=(SpeechStreamError,))
+
+        # Only a complete file is ever referenced from a document
+        content = _content_record(
+            "openai_audio", text, repository, commit_sha, branch, summary,
+            audio_file_ids=[audio_file_id],
+        )
         try:
-            audio_path = Path(result["file_path"])
-            audio_bytes = audio_path.read_bytes()
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-
-            # Create content model for MongoDB
-            from datetime import datetime, timezone
-            content = ContentModel(
-                repository=repository,
-                commit_sha=commit_sha,
-                branch=branch,
-                summary=summary,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                platform="openai_audio",
-                status="generated",
-                content=text,  # Original text input
-                audio_content=[audio_base64],
-                image_content=[],
-                video_content=[],
-            )
-
-            # Store in MongoDB
-            content_id = await content_controller.create(content)
-
-            # Clean up temp file
-            audio_path.unlink(missing_ok=True)
-
-            return {
-                "content_id": content_id,
-                "format": result["format"],
-                "content_type": result["content_type"],
-                "size_bytes": result["size_bytes"],
-                "storage": "mongodb",
-                "original_text": text,
-                "model": model,
-                "voice": voice,
-            }
-
-        except Exception as exc:
-            raise Exception(f"Failed to persist audio to MongoDB: {exc}") from exc
+            content_id = await _persist("audio", content_controller.create(content))
+        except BaseException:
+            # Without its document the file is unreachable, so don't leave it behind
+            try:
+                await content_controller.delete_audio(audio_file_id)
+            except Exception:
+                pass
+            raise
+
+        return {
+            "content_id": content_id,
+            "audio_file_id": audio_file_id,
+            "format": speech.format,
+            "content_type": speech.content_type,
+            "size_bytes": speech.size_bytes,
+            "storage": "mongodb",
+            "original_text": text,
+            "model": model,
+            "voice": voice,
+        }
 
 
 class ModelTools:
     @staticmethod
-    async def list_models(model_type: Optional[str] = None) -> Dict[str, Any]:
-        models: Dict[str, Any] = {
-            "text": [
-                {"id": "gpt-4o", "description": "Default GPT-4o flagship model"},
-                {"id": "gpt-4.1", "description": "Latest GPT-4.1 reasoning model"},
-                {"id": "gpt-4o-mini", "description": "Cost-efficient fast GPT-4o variant"},
-            ],
-            "image": [
-                {"id": "gpt-image-1", "description": "Latest multimodal image generator"},
-                {"id": "dall-e-3", "description": "High quality illustration model"},
-            ],
-            "audio": [
-                {"id": "gpt-4o-mini-tts", "description": "Text-to-speech voice generation"},
-                {"id": "tts-1-hd", "description": "Studio-grade text-to-speech"},
-            ],
-        }
-
+    async def list_models(model_type: str | None = None) -> dict[str, Any]:
         if model_type:
-            return {model_type: models.get(model_type, [])}
+            return {model_type: _MODELS_BY_TYPE.get(model_type, ())}
 
-        return models
+        return dict(_MODELS_BY_TYPE)
@@ -5,12 +5,111 @@ A standalone Python client for interacting with the Bluesky API using the atprot
 Provides functionality for authentication, posting, and managing Bluesky content.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timezone
+import random
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, Optional, List, TypeVar
 
-from atproto import Client
-from atproto.exceptions import AtProtocolError
+import httpx
+import regex
+from atproto import AsyncClient, AtUri, models
+from atproto.exceptions import AtProtocolError, RequestException
+from atproto_client.models import ids
+from atproto_client.request import AsyncRequest
+
+# One pooled, keep-alive connection set per client so login, thread lookups and
+# writes against the PDS reuse the same TLS session
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Retries for XRPC calls answered with 429 despite the proactive limiter
+MAX_RATE_LIMIT_RETRIES = 3
+# Longest wait for a rate-limit window to reset; longer windows (e.g. the daily
+# createSession limit) fail the call instead of stalling the request
+MAX_RATE_LIMIT_WAIT = 5.0
+
+# Post URI -> CID lookups used to build reply refs
+REPLY_CID_CACHE_SIZE = 1024
+REPLY_CID_TTL = 60.0
+
+# get_profile results are reused for this long; counts drift slowly
+PROFILE_CACHE_TTL = 30.0
+
+# Bluesky counts post length in grapheme clusters
+MAX_POST_GRAPHEMES = 300
+
+# app.bsky.actor.getProfiles takes at most this many actors; batches are fetched in parallel
+PROFILES_BATCH_SIZE = 25
+ENRICH_CONCURRENCY = 8
+
+# com.atproto.repo.applyWrites accepts at most this many operations per call
+APPLY_WRITES_MAX = 200
+
+T = TypeVar("T")
+
+
+class RateLimitedError(Exception):
+    """An XRPC endpoint's rate-limit window resets too far in the future to wait for."""
+
+    def __init__(self, nsid: str, reset_at: float):
+        self.nsid = nsid
+        self.reset_at = reset_at
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(reset_at))
+        super().__init__(f"Rate limit exceeded for {nsid}, resets at {reset}")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an AT Protocol style timestamp (millisecond precision, Z suffix)."""
+    now = time.time()
+    t = time.gmtime(now)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, int(now % 1 * 1000)
+    )
+
+
+# One match per extended grapheme cluster (UAX #29), as Bluesky counts post length
+_GRAPHEME_CLUSTER = regex.compile(r"\X")
+
+
+def _grapheme_length(text: str) -> int:
+    """Number of user-perceived characters (extended grapheme clusters) in text."""
+    return sum(1 for _ in _GRAPHEME_CLUSTER.finditer(text))
+
+
+class BlueskyWriteBatch:
+    """
+    Collects like/repost/follow/delete operations for a single applyWrites call.
+
+    Obtained from BlueskyClient.batch(); operations are sent when the block exits.
+    """
+
+    __slots__ = ("writes", "result", "_now_iso")
+
+    def __init__(self, now_iso: Callable[[], str]):
+        self.writes: List[Any] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self._now_iso = now_iso
+
+    def _create(self, collection: str, record: Any) -> None:
+        self.writes.append(models.ComAtprotoRepoApplyWrites.Create(collection=collection, value=record))
+
+    def like(self, post_uri: str, post_cid: str) -> None:
+        subject = models.ComAtprotoRepoStrongRef.Main(uri=post_uri, cid=post_cid)
+        self._create(ids.AppBskyFeedLike, models.AppBskyFeedLike.Record(subject=subject, created_at=self._now_iso()))
+
+    def repost(self, post_uri: str, post_cid: str) -> None:
+        subject = models.ComAtprotoRepoStrongRef.Main(uri=post_uri, cid=post_cid)
+        self._create(ids.AppBskyFeedRepost, models.AppBskyFeedRepost.Record(subject=subject, created_at=self._now_iso()))
+
+    def follow(self, did: str) -> None:
+        self._create(ids.AppBskyGraphFollow, models.AppBskyGraphFollow.Record(subject=did, created_at=self._now_iso()))
+
+    def delete(self, record_uri: str) -> None:
+        uri = AtUri.from_str(record_uri)
+        self.writes.append(models.ComAtprotoRepoApplyWrites.Delete(collection=uri.collection, rkey=uri.rkey))
 
 
 class BlueskyClient:
@@ -18,11 +117,25 @@ class BlueskyClient:
     A client for interacting with the Bluesky social network via the AT Protocol.
 
     Example usage:
-        client = BlueskyClient("user.bsky.social", "app-password")
-        await client.login()
-        result = await client.create_post("Hello Bluesky!")
+        async with BlueskyClient("user.bsky.social", "app-password") as client:
+            await client.login()
+            result = await client.create_post("Hello Bluesky!")
     """
 
+    __slots__ = (
+        "identifier",
+        "password",
+        "service_url",
+        "client",
+        "logged_in",
+        "profile",
+        "logger",
+        "_rate_limited_until",
+        "_reply_cid_cache",
+        "_profile_cache",
+        "_request",
+    )
+
     def __init__(
         self,
         identifier: str,
@@ -40,11 +153,116 @@ class BlueskyClient:
         self.identifier = identifier
         self.password = password
         self.service_url = service_url
-        self.client = Client(base_url=service_url)
+        # XRPC path -> unix time its exhausted rate-limit window resets
+        self._rate_limited_until: Dict[str, float] = {}
+        # Post URI -> (CID, monotonic expiry), LRU-ordered
+        self._reply_cid_cache: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        # Handle -> (get_profile result, monotonic expiry)
+        self._profile_cache: Dict[str, tuple[Dict[str, Any], float]] = {}
+        self._request = AsyncRequest(
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            http2=True,
+            event_hooks={"response": [self._record_rate_limit]},
+        )
+        self.client = AsyncClient(base_url=service_url, request=self._request)
         self.logged_in = False
         self.profile = None
         self.logger = logging.getLogger(__name__)
 
+    async def __aenter__(self) -> "BlueskyClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._request.close()
+
+    async def _record_rate_limit(self, response: httpx.Response) -> None:
+        """Remember exhausted RateLimit-* windows reported by the PDS."""
+        remaining = response.headers.get("ratelimit-remaining")
+        reset = response.headers.get("ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            if int(remaining) <= 0:
+                self._rate_limited_until[response.request.url.path] = float(reset)
+        except ValueError:
+            pass
+
+    async def _xrpc(self, nsid: str, call: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Issue an atproto call, waiting out a known exhausted window for its endpoint
+        and retrying 429 responses with exponential backoff.
+
+        Raises RateLimitedError without calling when the window resets more than
+        MAX_RATE_LIMIT_WAIT seconds from now.
+        """
+        path = f"/xrpc/{nsid}"
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self._wait_for_rate_limit(nsid, path)
+            try:
+                return await call(*args, **kwargs)
+            except RequestException as e:
+                status_code = getattr(e.response, "status_code", None)
+                if status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                reset_at = self._rate_limited_until.get(path)
+                if reset_at is not None:
+                    # The window is known; the next attempt waits for it or gives up
+                    if reset_at - time.time() > MAX_RATE_LIMIT_WAIT:
+                        raise RateLimitedError(nsid, reset_at) from e
+                    continue
+                await asyncio.sleep(2 ** attempt + random.random())
+
+    async def _wait_for_rate_limit(self, nsid: str, path: str) -> None:
+        """Sleep until the endpoint's exhausted window resets, if that is soon enough."""
+        reset_at = self._rate_limited_until.get(path)
+        if reset_at is None:
+            return
+        delay = reset_at - time.time()
+        if delay <= 0:
+            del self._rate_limited_until[path]
+        elif delay > MAX_RATE_LIMIT_WAIT:
+            raise RateLimitedError(nsid, reset_at)
+        else:
+            self.logger.info("Rate limit exhausted for %s, waiting %.1fs", nsid, delay)
+            await asyncio.sleep(delay)
+            self._rate_limited_until.pop(path, None)
+
+    def _remember_cid(self, post_uri: str, cid: str) -> None:
+        self._reply_cid_cache[post_uri] = (cid, time.monotonic() + REPLY_CID_TTL)
+        self._reply_cid_cache.move_to_end(post_uri)
+        while len(self._reply_cid_cache) > REPLY_CID_CACHE_SIZE:
+            self._reply_cid_cache.popitem(last=False)
+
+    async def _resolve_reply_cid(self, post_uri: str) -> Optional[str]:
+        """Return the CID of a post, from the cache or a thread lookup."""
+        cached = self._reply_cid_cache.get(post_uri)
+        if cached is not None:
+            cid, expires_at = cached
+            if expires_at > time.monotonic():
+                self._reply_cid_cache.move_to_end(post_uri)
+                return cid
+            del self._reply_cid_cache[post_uri]
+
+        reply_thread = await self._xrpc(
+            "app.bsky.feed.getPostThread", self.client.get_post_thread, post_uri
+        )
+        if not (reply_thread and reply_thread.thread):
+            return None
+        cid = reply_thread.thread.post.cid
+        self._remember_cid(post_uri, cid)
+        return cid
+
+    def _error_result(self, message: str, error: Exception, prefix: str = "") -> Dict[str, Any]:
+        """Log a failed call once, with the traceback at DEBUG, and build its error result."""
+        detail = str(error)
+        self.logger.error("%s: %s", message, detail, exc_info=self.logger.isEnabledFor(logging.DEBUG))
+        return {"success": False, "error": prefix + detail}
+
     async def login(self) -> bool:
         """
         Login to Bluesky using credentials.
@@ -53,18 +271,18 @@ class BlueskyClient:
             bool: True if login successful, False otherwise
         """
         try:
-            self.profile = self.client.login(self.identifier, self.password)
-            self.logged_in = True
-            self.logger.info(
-                f"Successfully logged in as {self.profile.handle} ({self.profile.did})"
+            self.profile = await self._xrpc(
+                "com.atproto.server.createSession", self.client.login, self.identifier, self.password
             )
+            self.logged_in = True
+            self.logger.info("Successfully logged in as %s (%s)", self.profile.handle, self.profile.did)
             return True
         except AtProtocolError as e:
-            self.logger.error(f"Login failed with AT Protocol error: {str(e)}")
+            self.logger.error("Login failed with AT Protocol error: %s", e)
             self.logged_in = False
             return False
         except Exception as e:
-            self.logger.error(f"Login failed: {str(e)}")
+            self.logger.error("Login failed: %s", e)
             self.logged_in = False
             return False
 
@@ -72,6 +290,9 @@ class BlueskyClient:
         """
         Ensure the client is logged in, attempt login if not.
 
+        Methods on this class inline the check so the logged-in path never
+        creates a coroutine; this stays for external callers.
+
         Returns:
             bool: True if logged in (or login successful), False otherwise
         """
@@ -84,16 +305,18 @@ class BlueskyClient:
         text: str,
         reply_to: Optional[str] = None,
         images: Optional[List[str]] = None,
-        langs: Optional[List[str]] = None
+        langs: Optional[List[str]] = None,
+        reply_to_cid: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create a post on Bluesky.
 
         Args:
-            text: The content of the post (max 300 characters)
+            text: The content of the post (max 300 graphemes)
             reply_to: Optional URI of the post to reply to
             images: Optional list of image paths or URLs to attach
             langs: Optional list of language codes (e.g., ["en", "es"])
+            reply_to_cid: Optional CID of the reply_to post; skips looking it up
 
         Returns:
             Dict containing:
@@ -102,10 +325,10 @@ class BlueskyClient:
                 - cid (str): CID of the created post (if successful)
                 - error (str): Error message (if failed)
         """
-        if not await self.ensure_logged_in():
+        if not self.logged_in and not await self.login():
             return {"success": False, "error": "Failed to login"}
 
-        if len(text) > 300:
+        if len(text) > MAX_POST_GRAPHEMES and _grapheme_length(text) > MAX_POST_GRAPHEMES:
             return {
                 "success": False,
                 "error": "Post text cannot exceed 300 characters"
@@ -116,64 +339,66 @@ class BlueskyClient:
             reply_ref = None
             if reply_to:
                 try:
-                    reply_thread = self.client.get_post_thread(reply_to)
-                    if reply_thread and reply_thread.thread:
-                        reply_ref = {
-                            "root": {
-                                "uri": reply_to,
-                                "cid": reply_thread.thread.post.cid
-                            },
-                            "parent": {
-                                "uri": reply_to,
-                                "cid": reply_thread.thread.post.cid
-                            }
-                        }
+                    reply_cid = reply_to_cid or await self._resolve_reply_cid(reply_to)
+                    if reply_cid:
+                        # Root and parent are the same post, so they share one ref
+                        ref = {"uri": reply_to, "cid": reply_cid}
+                        reply_ref = {"root": ref, "parent": ref}
                 except Exception as e:
-                    self.logger.warning(f"Could not set up reply: {str(e)}")
+                    self.logger.warning("Could not set up reply: %s", e)
 
             # Create the post using atproto client
-            response = self.client.send_post(
+            response = await self._xrpc(
+                "com.atproto.repo.createRecord",
+                self.client.send_post,
                 text=text,
                 reply_to=reply_ref if reply_ref else None,
                 langs=langs
             )
 
+            # Replies to this post can then skip the thread lookup
+            self._remember_cid(response.uri, response.cid)
+
             result = {
                 "success": True,
                 "uri": response.uri,
                 "cid": response.cid,
                 "text": text,
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "created_at": _utc_now_iso()
             }
 
-            self.logger.info(f"Successfully posted to Bluesky: {text[:50]}...")
+            self.logger.info("Successfully posted to Bluesky: %.50s...", text)
             return result
 
         except AtProtocolError as e:
-            self.logger.error(f"Failed to post with AT Protocol error: {str(e)}")
-            return {"success": False, "error": f"AT Protocol error: {str(e)}"}
+            return self._error_result("Failed to post with AT Protocol error", e, prefix="AT Protocol error: ")
         except Exception as e:
-            self.logger.error(f"Failed to post: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to post", e)
 
     async def get_profile(self, handle: Optional[str] = None) -> Dict[str, Any]:
         """
         Get profile information for a user.
 
+        Results are cached per handle for PROFILE_CACHE_TTL seconds.
+
         Args:
             handle: Handle of the user (defaults to authenticated user)
 
         Returns:
             Dict containing profile information or error
         """
-        if not await self.ensure_logged_in():
+        if not self.logged_in and not await self.login():
             return {"success": False, "error": "Failed to login"}
 
         try:
             target_handle = handle or self.profile.handle
-            profile = self.client.get_profile(target_handle)
+            cached = self._profile_cache.get(target_handle)
+            if cached is not None and cached[1] > time.monotonic():
+                return dict(cached[0])
 
-            return {
+            profile = await self._xrpc("app.bsky.actor.getProfile", self.client.get_profile, target_handle)
+
+            result = {
                 "success": True,
                 "handle": profile.handle,
                 "display_name": profile.display_name,
@@ -183,9 +408,44 @@ class BlueskyClient:
                 "posts_count": profile.posts_count,
                 "did": profile.did
             }
+            self._profile_cache[target_handle] = (result, time.monotonic() + PROFILE_CACHE_TTL)
+            return dict(result)
         except Exception as e:
-            self.logger.error(f"Failed to get profile: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to get profile", e)
+
+    async def iter_timeline(self, limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the authenticated user's timeline posts one at a time.
+
+        Posts are projected from the feed JSON lazily, so a consumer that stops
+        early never builds the rest. Errors are raised rather than returned.
+
+        Args:
+            limit: Maximum number of posts to retrieve (default 50)
+        """
+        if not self.logged_in and not await self.login():
+            raise Exception("Failed to login")
+
+        # Raw query: the feed is projected straight from the JSON body instead of
+        # first being built into FeedViewPost models that are mostly discarded
+        nsid = "app.bsky.feed.getTimeline"
+        response = await self._xrpc(
+            nsid, self.client.invoke_query, nsid, params=models.AppBskyFeedGetTimeline.Params(limit=limit)
+        )
+
+        for feed_view in response.content.get("feed", ()):
+            post = feed_view["post"]
+            record = post.get("record", {})
+            yield {
+                "uri": post["uri"],
+                "cid": post["cid"],
+                "author": post["author"]["handle"],
+                "text": record.get("text", ""),
+                "created_at": record.get("createdAt"),
+                "like_count": post.get("likeCount"),
+                "reply_count": post.get("replyCount"),
+                "repost_count": post.get("repostCount")
+            }
 
     async def get_timeline(self, limit: int = 50) -> Dict[str, Any]:
         """
@@ -197,34 +457,69 @@ class BlueskyClient:
         Returns:
             Dict containing timeline posts or error
         """
-        if not await self.ensure_logged_in():
-            return {"success": False, "error": "Failed to login"}
-
         try:
-            timeline = self.client.get_timeline(limit=limit)
-
-            posts = []
-            for feed_view in timeline.feed:
-                post = feed_view.post
-                posts.append({
-                    "uri": post.uri,
-                    "cid": post.cid,
-                    "author": post.author.handle,
-                    "text": post.record.text if hasattr(post.record, "text") else "",
-                    "created_at": post.record.created_at if hasattr(post.record, "created_at") else None,
-                    "like_count": post.like_count,
-                    "reply_count": post.reply_count,
-                    "repost_count": post.repost_count
-                })
-
+            posts = [post async for post in self.iter_timeline(limit=limit)]
             return {
                 "success": True,
                 "posts": posts,
                 "count": len(posts)
             }
         except Exception as e:
-            self.logger.error(f"Failed to get timeline: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to get timeline", e)
+
+    async def get_timeline_enriched(self, limit: int = 50) -> Dict[str, Any]:
+        """
+        Get the timeline with each post's full author profile attached.
+
+        Distinct authors are resolved with batched getProfiles queries issued
+        concurrently, so the cost is a few parallel round trips rather than one
+        per post.
+
+        Args:
+            limit: Maximum number of posts to retrieve (default 50)
+
+        Returns:
+            Dict like get_timeline, with an "author_profile" entry on each post
+        """
+        timeline = await self.get_timeline(limit=limit)
+        if not timeline["success"]:
+            return timeline
+
+        handles = list(dict.fromkeys(post["author"] for post in timeline["posts"]))
+        semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+        nsid = "app.bsky.actor.getProfiles"
+
+        async def fetch_profiles(actors: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                response = await self._xrpc(
+                    nsid, self.client.invoke_query, nsid, params=models.AppBskyActorGetProfiles.Params(actors=actors)
+                )
+                return response.content.get("profiles", [])
+
+        try:
+            pages = await asyncio.gather(*(
+                fetch_profiles(handles[start:start + PROFILES_BATCH_SIZE])
+                for start in range(0, len(handles), PROFILES_BATCH_SIZE)
+            ))
+        except Exception as e:
+            return self._error_result("Failed to enrich timeline", e)
+
+        profiles = {
+            profile["handle"]: {
+                "handle": profile["handle"],
+                "display_name": profile.get("displayName"),
+                "description": profile.get("description"),
+                "followers_count": profile.get("followersCount"),
+                "follows_count": profile.get("followsCount"),
+                "posts_count": profile.get("postsCount"),
+                "did": profile["did"]
+            }
+            for page in pages
+            for profile in page
+        }
+        for post in timeline["posts"]:
+            post["author_profile"] = profiles.get(post["author"])
+        return timeline
 
     async def delete_post(self, post_uri: str) -> Dict[str, Any]:
         """
@@ -236,16 +531,15 @@ class BlueskyClient:
         Returns:
             Dict indicating success or failure
         """
-        if not await self.ensure_logged_in():
+        if not self.logged_in and not await self.login():
             return {"success": False, "error": "Failed to login"}
 
         try:
-            self.client.delete_post(post_uri)
-            self.logger.info(f"Successfully deleted post: {post_uri}")
+            await self._xrpc("com.atproto.repo.deleteRecord", self.client.delete_post, post_uri)
+            self.logger.info("Successfully deleted post: %s", post_uri)
             return {"success": True, "uri": post_uri}
         except Exception as e:
-            self.logger.error(f"Failed to delete post: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to delete post", e)
 
     async def like_post(self, post_uri: str, post_cid: str) -> Dict[str, Any]:
         """
@@ -258,19 +552,18 @@ class BlueskyClient:
         Returns:
             Dict indicating success or failure
         """
-        if not await self.ensure_logged_in():
+        if not self.logged_in and not await self.login():
             return {"success": False, "error": "Failed to login"}
 
         try:
-            response = self.client.like(post_uri, post_cid)
+            response = await self._xrpc("com.atproto.repo.createRecord", self.client.like, post_uri, post_cid)
             return {
                 "success": True,
                 "uri": response.uri,
                 "cid": response.cid
             }
         except Exception as e:
-            self.logger.error(f"Failed to like post: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to like post", e)
 
     async def repost(self, post_uri: str, post_cid: str) -> Dict[str, Any]:
         """
@@ -283,19 +576,18 @@ class BlueskyClient:
         Returns:
             Dict indicating success or failure
         """
-        if not await self.ensure_logged_in():
+        if not self.logged_in and not await self.login():
             return {"success": False, "error": "Failed to login"}
 
         try:
-            response = self.client.repost(post_uri, post_cid)
+            response = await self._xrpc("com.atproto.repo.createRecord", self.client.repost, post_uri, post_cid)
             return {
                 "success": True,
                 "uri": response.uri,
                 "cid": response.cid
             }
         except Exception as e:
-            self.logger.error(f"Failed to repost: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to repost", e)
 
     async def follow(self, did: str) -> Dict[str, Any]:
         """
@@ -307,22 +599,65 @@ class BlueskyClient:
         Returns:
             Dict indicating success or failure
         """
-        if not await self.ensure_logged_in():
+        if not self.logged_in and not await self.login():
             return {"success": False, "error": "Failed to login"}
 
         try:
-            response = self.client.follow(did)
+            response = await self._xrpc("com.atproto.repo.createRecord", self.client.follow, did)
             return {
                 "success": True,
                 "uri": response.uri,
                 "cid": response.cid
             }
         except Exception as e:
-            self.logger.error(f"Failed to follow user: {str(e)}")
-            return {"success": False, "error": str(e)}
+            return self._error_result("Failed to follow user", e)
+
+    async def apply_writes(self, writes: List[Any]) -> Dict[str, Any]:
+        """
+        Send create/delete operations for the authenticated repo in as few
+        applyWrites calls as possible.
+
+        Args:
+            writes: ComAtprotoRepoApplyWrites Create/Update/Delete operations
+
+        Returns:
+            Dict indicating success or failure and the number of operations sent
+        """
+        if not self.logged_in and not await self.login():
+            return {"success": False, "error": "Failed to login"}
+
+        try:
+            for start in range(0, len(writes), APPLY_WRITES_MAX):
+                data = models.ComAtprotoRepoApplyWrites.Data(
+                    repo=self.profile.did,
+                    writes=writes[start:start + APPLY_WRITES_MAX]
+                )
+                await self._xrpc("com.atproto.repo.applyWrites", self.client.com.atproto.repo.apply_writes, data)
+            return {"success": True, "count": len(writes)}
+        except Exception as e:
+            return self._error_result("Failed to apply writes", e)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[BlueskyWriteBatch]:
+        """
+        Coalesce likes, reposts, follows and deletes into one request.
+
+        Example usage:
+            async with client.batch() as batch:
+                batch.like(uri, cid)
+                batch.follow(did)
+            print(batch.result)
+        """
+        batch = BlueskyWriteBatch(self.client.get_current_time_iso)
+        yield batch
+        if batch.writes:
+            batch.result = await self.apply_writes(batch.writes)
+        else:
+            batch.result = {"success": True, "count": 0}
 
     def logout(self) -> None:
         """Logout and clear session."""
         self.logged_in = False
         self.profile = None
+        self._profile_cache.clear()
         self.logger.info("Logged out successfully")
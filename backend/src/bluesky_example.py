@@ -72,19 +72,20 @@ async def main():
         logger.error(f"Failed to create post: {post_result['error']}")
         return
 
-    # Example 3: Get timeline
-    logger.info("\n--- Getting Timeline (first 10 posts) ---")
-    timeline_result = await client.get_timeline(limit=10)
-
-    if timeline_result["success"]:
-        logger.info(f"Retrieved {timeline_result['count']} posts")
-        for i, post in enumerate(timeline_result['posts'][:3], 1):
+    # Example 3: Get timeline, reading only the posts we show
+    logger.info("\n--- Getting Timeline (first 3 of 10 posts) ---")
+    try:
+        i = 0
+        async for post in client.iter_timeline(limit=10):
+            i += 1
             logger.info(f"\nPost {i}:")
             logger.info(f"  Author: {post['author']}")
             logger.info(f"  Text: {post['text'][:100]}...")
             logger.info(f"  Likes: {post['like_count']}, Replies: {post['reply_count']}")
-    else:
-        logger.error(f"Failed to get timeline: {timeline_result['error']}")
+            if i == 3:
+                break
+    except Exception as e:
+        logger.error(f"Failed to get timeline: {e}")
 
     # Example 4: Reply to our post
     logger.info("\n--- Creating Reply ---")
@@ -119,6 +120,7 @@ async def main():
 
     # Logout
     client.logout()
+    await client.aclose()
     logger.info("\n--- Logged out ---")
 
 
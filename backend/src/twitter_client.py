@@ -1,23 +1,173 @@
 """
 Twitter Client
 
-A standalone Python client for interacting with the Twitter API v2 using the tweepy library.
+A standalone Python client for interacting with the Twitter API v2 using tweepy's asyncio client.
 Provides functionality for posting tweets, searching, threads, and more.
 """
 
+import asyncio
+import copy
 import logging
+import re
 import time
-from typing import Dict, Any, List, Optional
+import unicodedata
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import AsyncIterator, Dict, Any, Hashable, List, Optional
 from datetime import datetime, timezone
 
-import tweepy
-from tweepy import Client as TweepyClient
+import aiohttp
+from tweepy.asynchronous import AsyncClient
 from tweepy.errors import TweepyException, Forbidden, TooManyRequests
 
+# Every call goes to api.twitter.com, so the per-host cap is the effective pool size
+HTTP_MAX_CONNECTIONS = 100
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30.0, connect=5.0)
+DNS_CACHE_TTL = 300
+
+
+class Endpoint(IntEnum):
+    """Throttled v2 endpoints; values index the per-endpoint limiter lists."""
+
+    CREATE_TWEET = 0
+    DELETE_TWEET = 1
+    SEARCH_TWEETS = 2
+    LIKE = 3
+    RETWEET = 4
+    GET_USER = 5
+
+
+# Per-user request quotas as (requests, window seconds) for the v2 endpoints used below
+RATE_LIMITS: Dict[Endpoint, tuple[int, float]] = {
+    Endpoint.CREATE_TWEET: (200, 15 * 60),
+    Endpoint.DELETE_TWEET: (50, 15 * 60),
+    Endpoint.SEARCH_TWEETS: (180, 15 * 60),
+    Endpoint.LIKE: (50, 15 * 60),
+    Endpoint.RETWEET: (50, 15 * 60),
+    Endpoint.GET_USER: (900, 15 * 60),
+}
+
+# Failed calls map to (code, message template) by the first matching exception type
+ERROR_RESULTS: tuple[tuple[type, str, str], ...] = (
+    (TooManyRequests, "rate_limit_exceeded", "Rate limit exceeded. Please wait before trying again."),
+    (Forbidden, "forbidden", "Access forbidden: {}"),
+    (TweepyException, "twitter_api_error", "{}"),
+    (Exception, "internal_error", "Unexpected error: {}"),
+)
+
+# Concurrent requests allowed per endpoint; endpoints not listed get the default
+MAX_IN_FLIGHT: Dict[Endpoint, int] = {
+    Endpoint.CREATE_TWEET: 5,
+    Endpoint.SEARCH_TWEETS: 2,
+}
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Twitter weighs code points outside these ranges (CJK, emoji, ...) as two characters
+MAX_TWEET_WEIGHT = 280
+_LIGHT_CODE_POINTS = dict.fromkeys(
+    [*range(0x0000, 0x10FF + 1), *range(0x2000, 0x200D + 1), *range(0x2010, 0x201F + 1), *range(0x2032, 0x2037 + 1)]
+)
+# Twitter weighs a whole emoji sequence as two: flag pairs, keycaps, and pictographs
+# (or anything given emoji presentation by VS16) with their modifier, tag and ZWJ parts
+_EMOJI_ELEMENT = (
+    "(?:[\U0001F1E6-\U0001F1FF]{2}"
+    "|[0-9#*]\uFE0F?\u20E3"
+    "|(?:[\u2190-\u2BFF\U0001F000-\U0001FAFF]|.(?=\uFE0F))"
+    "[\uFE0E\uFE0F]?[\U0001F3FB-\U0001F3FF]?[\U000E0020-\U000E007F]*)"
+)
+_EMOJI_SEQUENCE = re.compile(f"{_EMOJI_ELEMENT}(?:\u200D{_EMOJI_ELEMENT})*")
+
+# Lookup results are reused for this long; profiles change slowly, searches tolerate brief staleness
+USER_CACHE_TTL = 300.0
+SEARCH_CACHE_TTL = 30.0
+RESPONSE_CACHE_SIZE = 1024
+
+
+def _cache_get(cache: "OrderedDict[Hashable, tuple[Dict[str, Any], float]]", key: Hashable) -> Optional[Dict[str, Any]]:
+    """Return a deep copy of a live cache entry, dropping it if expired."""
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    result, expires_at = cached
+    if expires_at <= time.monotonic():
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return copy.deepcopy(result)
+
+
+def _cache_put(
+    cache: "OrderedDict[Hashable, tuple[Dict[str, Any], float]]",
+    key: Hashable,
+    result: Dict[str, Any],
+    ttl: float,
+) -> None:
+    """Store a deep copy of result, so the caller that produced it may still modify its own."""
+    cache[key] = (copy.deepcopy(result), time.monotonic() + ttl)
+    cache.move_to_end(key)
+    while len(cache) > RESPONSE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _weighted_length(text: str) -> int:
+    """
+    Tweet length as counted by Twitter's weighted-character rules.
+
+    Text is NFC-normalized first, as Twitter does. Each emoji sequence
+    (skin tones, ZWJ families, flags, keycaps) counts two; of the remaining
+    code points light ones count one and everything else two, the heavy ones
+    being found by deleting the light ones with a single str.translate pass.
+    URLs are counted as typed rather than as 23-character t.co links.
+    """
+    if text.isascii():
+        return len(text)
+    rest, emoji_count = _EMOJI_SEQUENCE.subn("", unicodedata.normalize("NFC", text))
+    return len(rest) + len(rest.translate(_LIGHT_CODE_POINTS)) + 2 * emoji_count
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """
+    Token bucket that refills continuously at `rate` tokens per second.
+
+    Starts full, so an idle client can burst up to `capacity` requests; once
+    drained, acquire() waits for the next token instead of failing.
+    """
+
+    capacity: float
+    rate: float
+    tokens: float = field(init=False)
+    last_refill: float = field(init=False)
+    _lock: asyncio.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self, n: float = 1) -> None:
+        """Take n tokens, sleeping until enough have accumulated."""
+        n = min(n, self.capacity)
+        async with self._lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= n
+
 
 class TwitterError(Exception):
     """Custom Twitter API error."""
 
+    __slots__ = ("code", "status")
+
     def __init__(self, message: str, code: str, status: Optional[int] = None):
         super().__init__(message)
         self.code = code
@@ -34,13 +184,13 @@ class TwitterClient:
     A client for interacting with the Twitter API v2.
 
     Example usage:
-        client = TwitterClient(
+        async with TwitterClient(
             api_key="your-api-key",
             api_secret="your-api-secret",
             access_token="your-access-token",
             access_token_secret="your-access-token-secret"
-        )
-        result = await client.post_tweet("Hello Twitter!")
+        ) as client:
+            result = await client.post_tweet("Hello Twitter!")
     """
 
     def __init__(
@@ -67,22 +217,73 @@ class TwitterClient:
         self.access_token_secret = access_token_secret
         self.bearer_token = bearer_token
 
-        # Initialize tweepy client with OAuth 1.0a User Context
-        self.client = TweepyClient(
-            consumer_key=api_key,
-            consumer_secret=api_secret,
-            access_token=access_token,
-            access_token_secret=access_token_secret,
-            bearer_token=bearer_token
-        )
-
-        # Rate limiting
-        self.rate_limit_map: Dict[str, float] = {}
-        self.rate_limit_window = 1.0  # seconds between requests
+        # Built on first use; see the client property
+        self._client: Optional[AsyncClient] = None
+
+        # Client-side throttling, one bucket per endpoint
+        self.buckets: List[TokenBucket] = [
+            TokenBucket(capacity=requests, rate=requests / window)
+            for requests, window in (RATE_LIMITS[endpoint] for endpoint in Endpoint)
+        ]
+        # Per-endpoint in-flight counters, each guarded by its own condition so a
+        # released slot only wakes callers of that endpoint
+        self._slots: List[asyncio.Condition] = [asyncio.Condition() for _ in Endpoint]
+        self._in_flight: List[int] = [0] * len(Endpoint)
+        self._max_in_flight: List[int] = [MAX_IN_FLIGHT.get(endpoint, DEFAULT_MAX_IN_FLIGHT) for endpoint in Endpoint]
+        # Lowercased username -> (get_user result, monotonic expiry), LRU-ordered
+        self._user_cache: "OrderedDict[str, tuple[Dict[str, Any], float]]" = OrderedDict()
+        # (query, max_results) -> (search_tweets result, monotonic expiry), LRU-ordered
+        self._search_cache: "OrderedDict[tuple[str, int], tuple[Dict[str, Any], float]]" = OrderedDict()
 
         self.logger = logging.getLogger(__name__)
         self.logger.info("Twitter API client initialized")
 
+    @property
+    def client(self) -> AsyncClient:
+        """
+        The underlying tweepy client, created on first API call.
+
+        Uses OAuth 1.0a User Context over a single aiohttp session owned by this
+        client, so every call after the first reuses its pooled keep-alive
+        connections. Only read from coroutines: the session binds to the running loop.
+        """
+        if self._client is None:
+            self._client = AsyncClient(
+                consumer_key=self.api_key,
+                consumer_secret=self.api_secret,
+                access_token=self.access_token,
+                access_token_secret=self.access_token_secret,
+                bearer_token=self.bearer_token
+            )
+            self._client.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_MAX_CONNECTIONS,
+                    limit_per_host=HTTP_MAX_CONNECTIONS,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=HTTP_TIMEOUT,
+                # OAuth signs every request; nothing needs cookies kept between calls
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return self._client
+
+    async def __aenter__(self) -> "TwitterClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        # The next use of self.client builds a fresh session
+        session = client.session
+        if session is not None and not session.closed:
+            await session.close()
+
     async def post_tweet(self, text: str) -> Dict[str, Any]:
         """
         Post a tweet to Twitter.
@@ -98,17 +299,15 @@ class TwitterClient:
                 - url (str): Tweet URL (if successful)
                 - error (str): Error message (if failed)
         """
-        endpoint = "tweets/create"
-        await self._check_rate_limit(endpoint)
-
-        if len(text) > 280:
+        if _weighted_length(text) > MAX_TWEET_WEIGHT:
             return {
                 "success": False,
                 "error": "Tweet cannot exceed 280 characters"
             }
 
         try:
-            response = self.client.create_tweet(text=text)
+            async with self._throttle(Endpoint.CREATE_TWEET):
+                response = await self.client.create_tweet(text=text)
 
             tweet_id = response.data["id"]
             self.logger.info(f"Tweet posted successfully with ID: {tweet_id}")
@@ -121,34 +320,8 @@ class TwitterClient:
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
 
-        except TooManyRequests as e:
-            self.logger.error(f"Rate limit exceeded: {str(e)}")
-            return {
-                "success": False,
-                "error": "Rate limit exceeded. Please wait before trying again.",
-                "code": "rate_limit_exceeded"
-            }
-        except Forbidden as e:
-            self.logger.error(f"Forbidden error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Access forbidden: {str(e)}",
-                "code": "forbidden"
-            }
-        except TweepyException as e:
-            self.logger.error(f"Twitter API error: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "code": "twitter_api_error"
-            }
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}",
-                "code": "internal_error"
-            }
+            return self._error_result(e, "Failed to post tweet")
 
     async def search_tweets(
         self,
@@ -170,99 +343,89 @@ class TwitterClient:
                 - count (int): Number of tweets returned
                 - error (str): Error message (if failed)
         """
-        endpoint = "tweets/search"
-        await self._check_rate_limit(endpoint)
-
         if max_results < 10 or max_results > 100:
             return {
                 "success": False,
                 "error": "max_results must be between 10 and 100"
             }
 
+        cache_key = (query, max_results)
+        cached = _cache_get(self._search_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.client.search_recent_tweets(
-                query=query,
-                max_results=max_results,
-                expansions=["author_id"],
-                tweet_fields=["public_metrics", "created_at"],
-                user_fields=["username", "name", "verified"]
-            )
+            async with self._throttle(Endpoint.SEARCH_TWEETS):
+                response = await self.client.search_recent_tweets(
+                    query=query,
+                    max_results=max_results,
+                    expansions=["author_id"],
+                    tweet_fields=["public_metrics", "created_at"],
+                    user_fields=["username", "name", "verified"]
+                )
 
             if not response.data:
-                return {
+                result = {
                     "success": True,
                     "tweets": [],
                     "users": {},
                     "count": 0,
                     "query": query
                 }
+                _cache_put(self._search_cache, cache_key, result, SEARCH_CACHE_TTL)
+                return dict(result)
 
-            # Process tweets
-            tweets = []
-            for tweet in response.data:
-                tweets.append({
+            tweets = [
+                {
                     "id": tweet.id,
                     "text": tweet.text,
                     "author_id": tweet.author_id,
                     "metrics": {
-                        "likes": tweet.public_metrics.get("like_count", 0),
-                        "retweets": tweet.public_metrics.get("retweet_count", 0),
-                        "replies": tweet.public_metrics.get("reply_count", 0),
-                        "quotes": tweet.public_metrics.get("quote_count", 0)
+                        "likes": metrics.get("like_count", 0),
+                        "retweets": metrics.get("retweet_count", 0),
+                        "replies": metrics.get("reply_count", 0),
+                        "quotes": metrics.get("quote_count", 0)
                     },
                     "created_at": tweet.created_at.isoformat() if tweet.created_at else None,
                     "url": f"https://twitter.com/status/{tweet.id}"
-                })
-
-            # Process users
-            users = {}
-            if response.includes and "users" in response.includes:
-                for user in response.includes["users"]:
-                    users[user.id] = {
-                        "id": user.id,
-                        "username": user.username,
-                        "name": user.name,
-                        "verified": getattr(user, "verified", False)
-                    }
+                }
+                for tweet in response.data
+                for metrics in (tweet.public_metrics or {},)
+            ]
+
+            users = {
+                user.id: {
+                    "id": user.id,
+                    "username": user.username,
+                    "name": user.name,
+                    "verified": getattr(user, "verified", False)
+                }
+                for user in (response.includes or {}).get("users", ())
+            }
 
             self.logger.info(f"Fetched {len(tweets)} tweets for query: '{query}'")
 
-            return {
+            result = {
                 "success": True,
                 "tweets": tweets,
                 "users": users,
                 "count": len(tweets),
                 "query": query
             }
+            _cache_put(self._search_cache, cache_key, result, SEARCH_CACHE_TTL)
+            return dict(result)
 
-        except TooManyRequests as e:
-            self.logger.error(f"Rate limit exceeded: {str(e)}")
-            return {
-                "success": False,
-                "error": "Rate limit exceeded. Please wait before trying again.",
-                "code": "rate_limit_exceeded"
-            }
-        except TweepyException as e:
-            self.logger.error(f"Twitter API error: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "code": "twitter_api_error"
-            }
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}",
-                "code": "internal_error"
-            }
+            return self._error_result(e, "Failed to search tweets")
 
-    async def post_thread(self, tweets: List[str]) -> Dict[str, Any]:
+    async def post_thread(self, tweets: List[str], chain: bool = True) -> Dict[str, Any]:
         """
         Post a thread of tweets to Twitter.
 
         Args:
             tweets: List of tweet texts (each max 280 characters)
+            chain: Post each tweet as a reply to the previous one. When False the
+                tweets are independent and are posted concurrently.
 
         Returns:
             Dict containing:
@@ -272,47 +435,44 @@ class TwitterClient:
                 - count (int): Number of tweets in the thread
                 - error (str): Error message (if failed)
         """
-        endpoint = "tweets/create"
-        await self._check_rate_limit(endpoint)
-
         if not tweets:
             return {
                 "success": False,
                 "error": "Thread must contain at least one tweet"
             }
 
-        for i, tweet_text in enumerate(tweets):
-            if len(tweet_text) > 280:
-                return {
-                    "success": False,
-                    "error": f"Tweet {i + 1} exceeds 280 characters"
-                }
+        too_long = next(
+            (i for i, tweet_text in enumerate(tweets, 1) if _weighted_length(tweet_text) > MAX_TWEET_WEIGHT),
+            None
+        )
+        if too_long is not None:
+            return {
+                "success": False,
+                "error": f"Tweet {too_long} exceeds 280 characters"
+            }
 
         try:
-            posted_tweets = []
-            previous_tweet_id = None
-
-            for tweet_text in tweets:
-                # Create tweet with reply to previous if exists
-                if previous_tweet_id:
-                    response = self.client.create_tweet(
-                        text=tweet_text,
-                        in_reply_to_tweet_id=previous_tweet_id
-                    )
-                else:
-                    response = self.client.create_tweet(text=tweet_text)
-
-                tweet_id = response.data["id"]
-                posted_tweets.append({
-                    "id": tweet_id,
-                    "text": tweet_text,
-                    "url": f"https://twitter.com/status/{tweet_id}"
-                })
-
-                previous_tweet_id = tweet_id
-
-                # Add delay to prevent rate limiting
-                time.sleep(1)
+            if chain:
+                posted_tweets = []
+                previous_tweet_id = None
+
+                for tweet_text in tweets:
+                    # Each tweet replies to the previous one, so the chain has to stay sequential
+                    posted = await self._create_tweet(tweet_text, previous_tweet_id)
+                    posted_tweets.append(posted)
+                    previous_tweet_id = posted["id"]
+            else:
+                # Independent tweets; the tweets/create bucket and in-flight cap still apply per post
+                results = await asyncio.gather(
+                    *(self._create_tweet(tweet_text) for tweet_text in tweets), return_exceptions=True
+                )
+                posted_tweets = [result for result in results if not isinstance(result, BaseException)]
+                failed = next((result for result in results if isinstance(result, BaseException)), None)
+                if failed is not None:
+                    error_result = self._error_result(failed, "Failed to post tweets")
+                    # Some tweets may already be live; report them so callers can clean up
+                    error_result["tweets"] = posted_tweets
+                    return error_result
 
             thread_url = posted_tweets[0]["url"] if posted_tweets else ""
 
@@ -326,27 +486,19 @@ class TwitterClient:
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
 
-        except TooManyRequests as e:
-            self.logger.error(f"Rate limit exceeded: {str(e)}")
-            return {
-                "success": False,
-                "error": "Rate limit exceeded. Please wait before trying again.",
-                "code": "rate_limit_exceeded"
-            }
-        except TweepyException as e:
-            self.logger.error(f"Twitter API error: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "code": "twitter_api_error"
-            }
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}",
-                "code": "internal_error"
-            }
+            return self._error_result(e, "Failed to post thread")
+
+    async def _create_tweet(self, text: str, in_reply_to_tweet_id: Optional[str] = None) -> Dict[str, Any]:
+        """Post one tweet through the throttle and return its id/text/url entry."""
+        async with self._throttle(Endpoint.CREATE_TWEET):
+            response = await self.client.create_tweet(text=text, in_reply_to_tweet_id=in_reply_to_tweet_id)
+        tweet_id = response.data["id"]
+        return {
+            "id": tweet_id,
+            "text": text,
+            "url": f"https://twitter.com/status/{tweet_id}"
+        }
 
     async def delete_tweet(self, tweet_id: str) -> Dict[str, Any]:
         """
@@ -359,12 +511,12 @@ class TwitterClient:
             Dict indicating success or failure
         """
         try:
-            self.client.delete_tweet(tweet_id)
+            async with self._throttle(Endpoint.DELETE_TWEET):
+                await self.client.delete_tweet(tweet_id)
             self.logger.info(f"Successfully deleted tweet: {tweet_id}")
             return {"success": True, "id": tweet_id}
-        except TweepyException as e:
-            self.logger.error(f"Failed to delete tweet: {str(e)}")
-            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return self._error_result(e, "Failed to delete tweet")
 
     async def like_tweet(self, tweet_id: str) -> Dict[str, Any]:
         """
@@ -377,11 +529,11 @@ class TwitterClient:
             Dict indicating success or failure
         """
         try:
-            response = self.client.like(tweet_id)
+            async with self._throttle(Endpoint.LIKE):
+                response = await self.client.like(tweet_id)
             return {"success": True, "liked": response.data["liked"]}
-        except TweepyException as e:
-            self.logger.error(f"Failed to like tweet: {str(e)}")
-            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return self._error_result(e, "Failed to like tweet")
 
     async def retweet(self, tweet_id: str) -> Dict[str, Any]:
         """
@@ -394,11 +546,11 @@ class TwitterClient:
             Dict indicating success or failure
         """
         try:
-            response = self.client.retweet(tweet_id)
+            async with self._throttle(Endpoint.RETWEET):
+                response = await self.client.retweet(tweet_id)
             return {"success": True, "retweeted": response.data["retweeted"]}
-        except TweepyException as e:
-            self.logger.error(f"Failed to retweet: {str(e)}")
-            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return self._error_result(e, "Failed to retweet")
 
     async def get_user(self, username: str) -> Dict[str, Any]:
         """
@@ -410,17 +562,24 @@ class TwitterClient:
         Returns:
             Dict containing user information or error
         """
+        # Usernames are case-insensitive
+        cache_key = username.lower()
+        cached = _cache_get(self._user_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.client.get_user(
-                username=username,
-                user_fields=["public_metrics", "description", "verified", "created_at"]
-            )
+            async with self._throttle(Endpoint.GET_USER):
+                response = await self.client.get_user(
+                    username=username,
+                    user_fields=["public_metrics", "description", "verified", "created_at"]
+                )
 
             if not response.data:
                 return {"success": False, "error": "User not found"}
 
             user = response.data
-            return {
+            result = {
                 "success": True,
                 "id": user.id,
                 "username": user.username,
@@ -432,27 +591,61 @@ class TwitterClient:
                 "tweet_count": user.public_metrics.get("tweet_count", 0),
                 "created_at": user.created_at.isoformat() if user.created_at else None
             }
-        except TweepyException as e:
-            self.logger.error(f"Failed to get user: {str(e)}")
-            return {"success": False, "error": str(e)}
+            _cache_put(self._user_cache, cache_key, result, USER_CACHE_TTL)
+            return dict(result)
+        except Exception as e:
+            return self._error_result(e, "Failed to get user")
+
+    def _error_result(self, error: Exception, action: str) -> Dict[str, Any]:
+        """Log a failed call once and build its error result, coded by exception type."""
+        for error_type, code, template in ERROR_RESULTS:
+            if isinstance(error, error_type):
+                break
+        self.logger.error("%s: %s", action, error, exc_info=self.logger.isEnabledFor(logging.DEBUG))
+        return {"success": False, "error": template.format(error), "code": code}
 
-    async def _check_rate_limit(self, endpoint: str) -> None:
+    async def set_max_in_flight(self, endpoint: Endpoint, limit: int) -> None:
         """
-        Check and enforce rate limiting.
+        Change how many requests to an endpoint may run concurrently.
 
         Args:
-            endpoint: API endpoint identifier
+            endpoint: Throttled API endpoint
+            limit: New concurrency cap (at least 1)
+        """
+        condition = self._slots[endpoint]
+        async with condition:
+            self._max_in_flight[endpoint] = max(1, limit)
+            # Waiters re-check the cap when woken; a raised cap may admit several at once
+            condition.notify_all()
 
-        Raises:
-            TwitterError: If rate limit would be exceeded
+    async def _check_rate_limit(self, endpoint: Endpoint) -> None:
         """
-        last_request = self.rate_limit_map.get(endpoint)
-        if last_request:
-            time_since_last = time.time() - last_request
-            if time_since_last < self.rate_limit_window:
-                raise TwitterError(
-                    "Rate limit exceeded",
-                    "rate_limit_exceeded",
-                    429
-                )
-        self.rate_limit_map[endpoint] = time.time()
+        Wait for a token from the endpoint's bucket, then for a free in-flight slot.
+
+        Every successful call must be paired with _release_slot(endpoint).
+
+        Args:
+            endpoint: Throttled API endpoint
+        """
+        await self.buckets[endpoint].acquire()
+        condition = self._slots[endpoint]
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight[endpoint] < self._max_in_flight[endpoint])
+            self._in_flight[endpoint] += 1
+
+    async def _release_slot(self, endpoint: Endpoint) -> None:
+        """Free an in-flight slot taken by _check_rate_limit and wake one waiter."""
+        # Decrement before awaiting the lock so a cancelled release cannot leak the slot
+        self._in_flight[endpoint] -= 1
+        condition = self._slots[endpoint]
+        async with condition:
+            condition.notify(1)
+
+    @asynccontextmanager
+    async def _throttle(self, endpoint: Endpoint) -> AsyncIterator[None]:
+        """Hold a rate-limit token and an in-flight slot for the duration of one API call."""
+        await self._check_rate_limit(endpoint)
+        try:
+            yield
+        finally:
+            await self._release_slot(endpoint)
@@ -0,0 +1,101 @@
+"""Shared plumbing for the manual MCP run scripts in this directory."""
+
+import asyncio
+import os
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Any, Coroutine, List, Optional, Sequence, Tuple, Union
+
+
+@cache
+def ensure_backend_on_path() -> None:
+    """Make the backend modules importable; the path work happens once per process."""
+    backend_dir = str(Path(__file__).resolve().parents[1])
+    if backend_dir not in sys.path:
+        sys.path.append(backend_dir)
+
+
+ensure_backend_on_path()
+
+# Importing the executor also loads backend/.env, so credentials are checked after it
+from executor import execute_mcp_client, run_async, shutdown_executor  # noqa: E402
+
+
+def check_env(required: Sequence[str]) -> Tuple[List[str], str]:
+    """
+    Return the unset required variables and the LLM provider to default to.
+
+    Looks each variable up once. The environment is read at call time rather
+    than snapshotted, since the executor may reload backend/.env between runs.
+    """
+    environ = os.environ
+    missing = [key for key in required if not environ.get(key)]
+    if environ.get("OPENAI_API_KEY"):
+        provider = "openai"
+    elif environ.get("BLACKBOX_API_KEY"):
+        provider = "blackbox"
+    else:
+        provider = "openai"
+    return missing, provider
+
+
+async def run_prompt(
+    prompt: str,
+    server_names: List[str],
+    prompt_name: str,
+    required_env: Sequence[str] = (),
+    env_label: str = "credentials",
+    provider: Optional[str] = None,
+) -> None:
+    """
+    Run one prompt through the executor and print each server's result.
+
+    Args:
+        prompt: The prompt text to send
+        server_names: MCP servers to run it against
+        prompt_name: Name identifier for the prompt
+        required_env: Environment variables that must be set, else the run is skipped
+        env_label: What the required variables are, for the skip message
+        provider: LLM provider default; falls back to whichever API key is configured
+    """
+    missing, fallback = check_env(required_env)
+    if missing:
+        print(f"Missing {env_label}:", ", ".join(missing))
+        return
+
+    os.environ.setdefault("MCP_LLM_PROVIDER", provider or fallback)
+
+    results = await execute_mcp_client(prompt, server_names, prompt_name=prompt_name)
+    for result in results:
+        print(f"\nServer: {result.server_name}")
+        print(f"Status: {result.status}")
+        if result.content:
+            print("Response:\n" + result.content)
+        if result.error:
+            print("Error:\n" + result.error)
+
+
+async def _run_then_shutdown(coro: Coroutine[Any, Any, None]) -> None:
+    try:
+        await coro
+    finally:
+        # Stop the MCP server subprocesses the executor keeps alive between prompts
+        await shutdown_executor()
+
+
+def main(coro: Coroutine[Any, Any, None]) -> Union[None, "asyncio.Task[None]"]:
+    """
+    Entry point for the run scripts.
+
+    Under a harness that already has a loop running, schedule the run on it and
+    return the task; the harness then owns the loop and the shared executor, whose
+    server connections carry over to the next script. Otherwise run it to
+    completion on a fresh loop (uvloop when installed) and shut the executor
+    down afterwards.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return run_async(_run_then_shutdown(coro))
+    return loop.create_task(coro)
@@ -1,61 +1,30 @@
 #!/usr/bin/env python3
 """Manual run for the Bluesky MCP create-thread tool via the executor."""
 
-import asyncio
-import os
-import sys
-from pathlib import Path
+from _mcp_runner import main, run_prompt
 
-BACKEND_DIR = Path(__file__).resolve().parents[1]
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.append(str(BACKEND_DIR))
-
-from executor import execute_mcp_client
-
-REQUIRED_ENV_VARS = [
+REQUIRED_ENV_VARS = (
     "BLUESKY_IDENTIFIER",
     "BLUESKY_APP_PASSWORD",
-]
-
-
-def _provider_fallback() -> str:
-    if os.getenv("OPENAI_API_KEY"):
-        return "openai"
-    if os.getenv("BLACKBOX_API_KEY"):
-        return "blackbox"
-    return "openai"
+)
 
-
-def _validate_env() -> bool:
-    missing = [key for key in REQUIRED_ENV_VARS if not os.getenv(key)]
-    if missing:
-        print("Missing Bluesky credentials:", ", ".join(missing))
-        return False
-    return True
+PROMPT = (
+    "Use the bluesky create-thread tool with two posts: "
+    "Post 1 -> 'Thread check-in: exploring MCP tooling.' "
+    "Post 2 -> 'Follow-up: share your favorite automation tips.' "
+    "After posting, summarize the returned URIs."
+)
 
 
 async def run() -> None:
-    if not _validate_env():
-        return
-
-    os.environ.setdefault("MCP_LLM_PROVIDER", _provider_fallback())
-
-    prompt = (
-        "Use the bluesky create-thread tool with two posts: "
-        "Post 1 -> 'Thread check-in: exploring MCP tooling.' "
-        "Post 2 -> 'Follow-up: share your favorite automation tips.' "
-        "After posting, summarize the returned URIs."
+    await run_prompt(
+        PROMPT,
+        ["bluesky"],
+        prompt_name="bluesky_create_thread",
+        required_env=REQUIRED_ENV_VARS,
+        env_label="Bluesky credentials",
     )
 
-    results = await execute_mcp_client(prompt, ["bluesky"], prompt_name="bluesky_create_thread")
-    for result in results:
-        print(f"\nServer: {result.server_name}")
-        print(f"Status: {result.status}")
-        if result.content:
-            print("Response:\n" + result.content)
-        if result.error:
-            print("Error:\n" + result.error)
-
 
 if __name__ == "__main__":
-    asyncio.run(run())
+    main(run())
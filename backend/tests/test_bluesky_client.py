@@ -0,0 +1,175 @@
+"""Offline checks for src.bluesky_client; no network or credentials needed."""
+
+import time
+
+import httpx
+import pytest
+
+from src.bluesky_client import BlueskyClient, _grapheme_length
+
+
+TIMELINE = {
+    "feed": [
+        {
+            "post": {
+                "uri": "at://did:plc:alice/app.bsky.feed.post/1",
+                "cid": "bafy-one",
+                "author": {"did": "did:plc:alice", "handle": "alice.bsky.social"},
+                "record": {"text": "hello", "createdAt": "2024-01-01T00:00:00Z"},
+                "likeCount": 3,
+                "replyCount": 1,
+                "repostCount": 0,
+                "indexedAt": "2024-01-01T00:00:00Z",
+            }
+        },
+        {
+            "post": {
+                "uri": "at://did:plc:bob/app.bsky.feed.post/2",
+                "cid": "bafy-two",
+                "author": {"did": "did:plc:bob", "handle": "bob.bsky.social"},
+                "record": {},
+                "indexedAt": "2024-01-01T00:00:00Z",
+            }
+        },
+    ]
+}
+
+
+@pytest.mark.parametrize(("text", "expected"), [
+    ("hello", 5),
+    ("a\r\nb", 3),
+    ("caf\u00e9", 4),
+    ("cafe\u0301", 4),  # combining acute
+    ("\U0001F44D\U0001F3FD", 1),  # skin tone modifier
+    ("\u2764\uFE0F", 1),  # variation selector
+    ("\U0001F468\u200D\U0001F469\u200D\U0001F467", 1),  # ZWJ family
+    ("\U0001F1E9\U0001F1EA\U0001F1EB\U0001F1F7", 2),  # two flags
+    ("\uAC01", 1),  # precomposed Hangul syllable
+    ("\u1100\u1161\u11A8", 1),  # the same syllable as L V T jamo
+    ("\uAC00\u11A8", 1),  # LV syllable plus trailing jamo
+    ("\u1100\u1161\u1100\u1161", 2),  # two L V syllables
+    ("\u0915\u094D\u0937\u093F", 1),  # Devanagari conjunct with vowel sign
+    ("\u0928\u092E\u0938\u094D\u0924\u0947", 3),  # namaste
+    ("\u0B95\u0BCD\u0BB7", 2),  # Tamil virama does not form a conjunct
+    ("\U0001F3F4\U000E0067\U000E0062\U000E0065\U000E006E\U000E0067\U000E007F", 1),  # England tag-sequence flag
+    ("\u0E01\u0E33", 1),  # Thai consonant with SpacingMark sara am
+    ("a\u200db", 2),  # ZWJ only joins emoji
+    ("\u200d", 1),  # lone ZWJ
+])
+def test_grapheme_length(text, expected):
+    assert _grapheme_length(text) == expected
+
+
+def offline_client(handler) -> BlueskyClient:
+    """A logged-in client whose XRPC requests are answered by handler."""
+    client = BlueskyClient("user.bsky.social", "app-password")
+    client._request._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.logged_in = True
+    return client
+
+
+def test_module_imports_and_client_constructs():
+    client = BlueskyClient("user.bsky.social", "app-password")
+    assert client.logged_in is False
+    assert client.service_url == "https://bsky.social"
+
+
+@pytest.mark.asyncio
+async def test_get_timeline_projects_feed_json():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=TIMELINE)
+
+    async with offline_client(handler) as client:
+        result = await client.get_timeline(limit=2)
+
+    assert requests[0].url.path == "/xrpc/app.bsky.feed.getTimeline"
+    assert requests[0].url.params["limit"] == "2"
+    assert result == {
+        "success": True,
+        "count": 2,
+        "posts": [
+            {
+                "uri": "at://did:plc:alice/app.bsky.feed.post/1",
+                "cid": "bafy-one",
+                "author": "alice.bsky.social",
+                "text": "hello",
+                "created_at": "2024-01-01T00:00:00Z",
+                "like_count": 3,
+                "reply_count": 1,
+                "repost_count": 0,
+            },
+            {
+                "uri": "at://did:plc:bob/app.bsky.feed.post/2",
+                "cid": "bafy-two",
+                "author": "bob.bsky.social",
+                "text": "",
+                "created_at": None,
+                "like_count": None,
+                "reply_count": None,
+                "repost_count": None,
+            },
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_timeline_stops_early():
+    async with offline_client(lambda request: httpx.Response(200, json=TIMELINE)) as client:
+        async for post in client.iter_timeline(limit=2):
+            break
+
+    assert post["author"] == "alice.bsky.social"
+
+
+@pytest.mark.asyncio
+async def test_get_timeline_enriched_attaches_profiles():
+    profile_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/xrpc/app.bsky.feed.getTimeline":
+            return httpx.Response(200, json=TIMELINE)
+        profile_requests.append(request)
+        return httpx.Response(200, json={"profiles": [
+            {"did": "did:plc:alice", "handle": "alice.bsky.social", "displayName": "Alice", "followersCount": 10},
+        ]})
+
+    async with offline_client(handler) as client:
+        result = await client.get_timeline_enriched(limit=2)
+
+    assert result["success"] is True
+    assert [request.url.path for request in profile_requests] == ["/xrpc/app.bsky.actor.getProfiles"]
+    assert profile_requests[0].url.params.get_list("actors") == ["alice.bsky.social", "bob.bsky.social"]
+    alice, bob = result["posts"]
+    assert alice["author_profile"] == {
+        "handle": "alice.bsky.social",
+        "display_name": "Alice",
+        "description": None,
+        "followers_count": 10,
+        "follows_count": None,
+        "posts_count": None,
+        "did": "did:plc:alice",
+    }
+    assert bob["author_profile"] is None
+
+
+@pytest.mark.asyncio
+async def test_distant_rate_limit_reset_fails_without_calling():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=TIMELINE)
+
+    async with offline_client(handler) as client:
+        client._rate_limited_until["/xrpc/app.bsky.feed.getTimeline"] = time.time() + 3600
+        client._rate_limited_until["/xrpc/app.bsky.actor.getProfile"] = time.time() - 1
+        result = await client.get_timeline(limit=2)
+        await client._wait_for_rate_limit("app.bsky.actor.getProfile", "/xrpc/app.bsky.actor.getProfile")
+
+    assert result["success"] is False
+    assert "resets at" in result["error"]
+    assert requests == []
+    assert "/xrpc/app.bsky.actor.getProfile" not in client._rate_limited_until
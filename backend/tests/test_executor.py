@@ -0,0 +1,99 @@
+"""Lifecycle checks for the executor's persistent MCP app, against a local stdio server."""
+
+import asyncio
+import sys
+
+import pytest
+
+PROBE_SERVER = '''
+import os
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("probe")
+
+
+@mcp.tool()
+def pid() -> str:
+    return f"{os.getpid()}:{os.environ.get('PROBE_TAG', '')}"
+
+
+mcp.run()
+'''
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("MONGODB_URI", "mongodb://localhost:27017")
+    monkeypatch.setenv("MCP_LLM_PROVIDER", "openai")
+    from executor import MCPAgentExecutor
+
+    server = tmp_path / "probe_server.py"
+    server.write_text(PROBE_SERVER)
+    executor = MCPAgentExecutor()
+    executor._server_config = {
+        "probe": {
+            "command": sys.executable,
+            "args": [str(server)],
+            "cwd": str(tmp_path),
+            "env_vars": {"PROBE_TAG": "PROBE_TAG"},
+        }
+    }
+    executor._setup_mcp_app()
+    return executor
+
+
+async def probe(executor, hold: float = 0.0) -> str:
+    """Call the probe tool through a per-call agent, as _generate does."""
+    async with executor._lease() as agent_app:
+        agent = await executor._create_agent(["probe"], agent_app)
+        async with agent:
+            await asyncio.sleep(hold)
+            result = await agent.call_tool("probe_pid", {})
+            return result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_server_process_is_shared_across_calls(executor):
+    async with executor:
+        first = await probe(executor)
+        assert await probe(executor) == first
+        assert await asyncio.gather(probe(executor), probe(executor)) == [first, first]
+    assert executor._app_task is None
+
+
+@pytest.mark.asyncio
+async def test_env_restart_waits_for_in_flight_calls(executor):
+    async with executor:
+        before = await probe(executor)
+
+        async def update_then_probe():
+            await asyncio.sleep(0.1)
+            executor.update_server_env({"PROBE_TAG": "new"}, ["probe"])
+            return await probe(executor)
+
+        held, after = await asyncio.gather(probe(executor, hold=0.5), update_then_probe())
+
+    # The held call finished on the old server before it was replaced
+    assert held == before
+    assert after.endswith(":new")
+    assert after.split(":")[0] != before.split(":")[0]
+
+
+@pytest.mark.asyncio
+async def test_dead_app_is_restarted_by_the_next_call(executor):
+    async with executor:
+        before = await probe(executor)
+
+        async def crash():
+            raise RuntimeError("owner task died")
+
+        # Replace the owner task with one that has already failed
+        executor._app_stop.set()
+        await executor._app_task
+        executor._app_task = asyncio.create_task(crash())
+        await asyncio.gather(executor._app_task, return_exceptions=True)
+
+        after = await probe(executor)
+
+    assert after.split(":")[0] != before.split(":")[0]
@@ -11,8 +11,32 @@ integration with MongoDB and MCP executors.
 import asyncio
 from datetime import datetime, timezone
 import json
+import sys
 
 import httpx
+import orjson
+
+# One pooled client reused by every call in this process
+_CLIENT: httpx.AsyncClient | None = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=2.0),
+            # Plain HTTP to a local server, so HTTP/1.1 (httpx has no h2c) and the default
+            # pool limits; retries only cover failed connection attempts, never a sent request
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+    return _CLIENT
+
+
+async def _close_client() -> None:
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
 
 
 async def test_generate_content_endpoint(base_url: str = "http://localhost:8001") -> None:
@@ -31,20 +55,22 @@ async def test_generate_content_endpoint(base_url: str = "http://localhost:8001"
     print(f"POST {base_url}/generate-content")
     print("Payload:")
     print(json.dumps(payload, indent=2))
+    body_bytes = orjson.dumps(payload)
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{base_url}/generate-content",
-                json=payload,
-            )
+        client = await _get_client()
+        response = await client.post(
+            f"{base_url}/generate-content",
+            content=body_bytes,
+            headers={"Content-Type": "application/json"},
+        )
 
         print(f"\nResponse status: {response.status_code}")
         print("Response headers:")
-        print(json.dumps(dict(response.headers), indent=2))
+        sys.stdout.writelines(f"  {name}: {value}\n" for name, value in response.headers.multi_items())
 
         try:
-            body = response.json()
+            body = orjson.loads(response.content)
             print("\nResponse body:")
             print(json.dumps(body, indent=2))
 
@@ -54,7 +80,7 @@ async def test_generate_content_endpoint(base_url: str = "http://localhost:8001"
                 print(f"Processed prompts: {len(body.get('results', []))}")
             else:
                 print("\n[ERROR] Request failed; see details above.")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print("\n[ERROR] Response body is not valid JSON:")
             print(response.text)
 
@@ -62,6 +88,13 @@ async def test_generate_content_endpoint(base_url: str = "http://localhost:8001"
         print(f"\n[ERROR] Error calling /generate-content: {exc}")
 
 
+async def main() -> None:
+    try:
+        await test_generate_content_endpoint()
+    finally:
+        await _close_client()
+
+
 if __name__ == "__main__":
     print("Make sure the FastAPI server is running before executing this script.")
-    asyncio.run(test_generate_content_endpoint())
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""Offline checks for src.twitter_client; no network or credentials needed."""
+
+from collections import OrderedDict
+
+import pytest
+
+from src.twitter_client import MAX_TWEET_WEIGHT, TwitterClient, _cache_get, _cache_put, _weighted_length
+
+
+@pytest.mark.parametrize(("text", "expected"), [
+    ("hello", 5),
+    ("", 0),
+    ("café", 4),
+    ("cafe\u0301", 4),  # decomposed é is normalized to one light code point
+    ("日本語", 6),
+    ("✓ done", 7),
+    ("👍", 2),
+    ("👍🏽", 2),  # skin tone modifier
+    ("❤️", 2),  # VS16
+    ("👨‍👩‍👧‍👦", 2),  # ZWJ family
+    ("🏳️‍🌈", 2),  # ZWJ with VS16
+    ("🇩🇪🇫🇷", 4),  # two flags
+    ("1️⃣", 2),  # keycap
+    ("🏴󠁧󠁢󠁳󠁣󠁴󠁿", 2),  # tag sequence
+    ("hi 👋🏻 there", 11),
+])
+def test_weighted_length(text, expected):
+    assert _weighted_length(text) == expected
+
+
+def test_emoji_sequences_fit_the_limit_like_single_emoji():
+    assert _weighted_length("👍🏽" * (MAX_TWEET_WEIGHT // 2)) == MAX_TWEET_WEIGHT
+    assert _weighted_length("👍🏽" * (MAX_TWEET_WEIGHT // 2 + 1)) > MAX_TWEET_WEIGHT
+
+
+@pytest.mark.asyncio
+async def test_client_reopens_after_aclose():
+    twitter = TwitterClient("key", "secret", "token", "token-secret")
+    async with twitter:
+        first = twitter.client
+    assert first.session.closed
+
+    async with twitter:
+        assert twitter.client is not first
+        assert not twitter.client.session.closed
+
+
+def test_cached_results_are_not_shared_with_callers():
+    cache = OrderedDict()
+    result = {"success": True, "tweets": [{"id": "1", "metrics": {"like_count": 1}}]}
+    _cache_put(cache, "query", result, ttl=30.0)
+    result["tweets"][0]["metrics"]["like_count"] = 2
+
+    first = _cache_get(cache, "query")
+    first["tweets"].append({"id": "2"})
+
+    assert _cache_get(cache, "query") == {"success": True, "tweets": [{"id": "1", "metrics": {"like_count": 1}}]}
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useRef } from 'react';
 import './styles/index.css';
-import { getContentItems, updateContentStatus, updateContentText, testBackendConnection, rephraseContent, approveAndPost, ContentItem } from './utils/backendApi';
+import { getContentItems, updateContentStatus, updateContentText, testBackendConnection, rephraseContent, approveAndPost, getAudioFileUrl, ContentItem } from './utils/backendApi';
 import Header from './components/Header';
 import Sidebar from './components/Sidebar';
 import PostCard from './components/PostCard';
@@ -46,6 +46,20 @@ const convertContentItemToPost = (item: ContentItem): Post => {
         });
     }
 
+    // Add audio streamed from GridFS by file id
+    if (item.audio_file_ids && Array.isArray(item.audio_file_ids)) {
+        const offset = item.audio_content?.length ?? 0;
+        item.audio_file_ids.forEach((fileId: string, index: number) => {
+            if (fileId) {
+                media.push({
+                    url: getAudioFileUrl(item._id, fileId),
+                    type: 'audio',
+                    caption: `Audio ${offset + index + 1}`
+                });
+            }
+        });
+    }
+
     // Fallback to legacy media field if present
     if ((!media || media.length === 0) && item.media && Array.isArray(item.media)) {
         media.push(...item.media);
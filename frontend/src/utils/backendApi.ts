@@ -4,6 +4,10 @@ import { SocialEnvValues, toSocialEnvApiPayload } from '../types/social';
 
 const BACKEND_URL = (import.meta.env.VITE_BACKEND_URL as string) || 'http://localhost:8001';
 
+// URL of an audio file streamed from GridFS for a content item
+export const getAudioFileUrl = (contentId: string, fileId: string): string =>
+    `${BACKEND_URL}/content/${contentId}/audio/${fileId}`;
+
 export interface ContentItem {
     _id: string;
     repository: string;
@@ -18,7 +22,8 @@ export interface ContentItem {
     // Media arrays from backend
     image_content?: string[];  // Array of image URLs
     video_content?: string[];  // Array of video URLs
-    audio_content?: string[];  // Array of base64 audio data
+    audio_content?: string[];  // Array of base64 audio data (legacy)
+    audio_file_ids?: string[];  // GridFS audio file ids, streamed via getAudioFileUrl
     // Legacy media field (for backward compatibility)
     media?: Array<{
         url: string;